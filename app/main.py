@@ -1,10 +1,13 @@
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 import logging
+import swisseph as swe
 
 from app.routers import astrology
 
@@ -12,8 +15,24 @@ from app.routers import astrology
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the heavy dependencies at startup instead of on the first request."""
+    # The first calc_ut per planet pays for ephemeris file opens and
+    # table loads; do it once here so request latency stays flat
+    swe.set_ephe_path('./swisseph_data')
+    for planet_id in (swe.SUN, swe.MOON, swe.MERCURY, swe.VENUS, swe.MARS,
+                      swe.JUPITER, swe.SATURN, swe.TRUE_NODE):
+        swe.calc_ut(2451545.0, planet_id, swe.FLG_SWIEPH)
+    logger.info("Swiss Ephemeris warmed up")
+    yield
+    # Drain the shared Prokerala connection pool on shutdown
+    from app.services.prokerala_service import prokerala_service
+    await prokerala_service.aclose()
+
 # Create FastAPI app with enhanced configuration
 app = FastAPI(
+    lifespan=lifespan,
     title="🌟 Starlight Astrology API",
     description="""
 ## Comprehensive Astrology API for Birth Chart Generation
@@ -95,7 +95,7 @@ async def generate_detailed_report(request: DetailedReportRequest):
     """
     try:
         logger.info(f"Generating detailed report for {request.birth_date} {request.birth_time}")
-        report = birth_chart_service.generate_detailed_report(request)
+        report = await birth_chart_service.generate_detailed_report(request)
         logger.info("Detailed report generated successfully")
         return report
     
@@ -175,7 +175,7 @@ async def get_detailed_report_legacy(
             ayanamsa=ayanamsa
         )
         
-        report = birth_chart_service.generate_detailed_report(request)
+        report = await birth_chart_service.generate_detailed_report(request)
         return report
     
     except ValueError as e:
@@ -2,11 +2,13 @@
 Birth Chart Service using Prokerala API
 """
 
+import asyncio
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
 import pytz
 import os
-import json
+import orjson
 from dotenv import load_dotenv
 from openai import OpenAI
 
@@ -97,6 +99,54 @@ class OpenAIService:
             print(f"OpenAI API error: {str(e)}")
             return self._get_fallback_report(report_type, birth_chart_data)
     
+    def generate_all_reports(self, birth_chart_data: Dict[str, Any],
+                             person_name: Optional[str] = None) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Generate all five report sections in a single chat completion.
+
+        One JSON-mode request replaces five sequential roundtrips, so
+        report latency is one OpenAI call instead of the sum of five.
+        Returns None when OpenAI is unavailable or the call fails, so the
+        caller can fall back to template-based reports.
+        """
+        if not self.is_available():
+            return None
+
+        try:
+            chart_summary = self._prepare_chart_data(birth_chart_data, person_name)
+            prompt = (
+                "Analyze the following birth chart and respond with a JSON object "
+                "containing exactly these five keys: \"personality\", \"career\", "
+                "\"relationship\", \"health\", \"spiritual\". Each value must be a "
+                "string with the corresponding analysis:\n"
+                "- personality: personality traits, strengths, and potential areas for growth\n"
+                "- career: career potential, professional strengths, and optimal work environments\n"
+                "- relationship: relationship patterns, compatibility needs, and romantic tendencies\n"
+                "- health: health predispositions and wellness recommendations (not medical advice)\n"
+                "- spiritual: spiritual path, karmic patterns, and soul purpose\n\n"
+                f"{chart_summary}"
+            )
+
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": self._get_system_prompt()},
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
+                max_tokens=4000,
+                temperature=0.7
+            )
+
+            sections = orjson.loads(response.choices[0].message.content)
+            return {
+                report_type: self._parse_ai_response(sections.get(report_type, ""), report_type)
+                for report_type in ("personality", "career", "relationship", "health", "spiritual")
+            }
+
+        except Exception as e:
+            print(f"OpenAI API error: {str(e)}")
+            return None
+
     def _prepare_chart_data(self, birth_chart_data: Dict[str, Any], person_name: Optional[str]) -> str:
         """Prepare birth chart data for AI analysis."""
         name = person_name or "the individual"
@@ -137,6 +187,44 @@ class OpenAIService:
         
         return chart_info
 
+@lru_cache(maxsize=256)
+def _validate_birth_data_cached(birth_date: str, birth_time: str, latitude: float,
+                                longitude: float, timezone_str: Optional[str]) -> None:
+    """Validate birth data, memoized so repeated identical inputs skip the
+    strptime and pytz lookups. Failures raise and are never cached."""
+    errors = []
+
+    # Validate date format
+    try:
+        date_obj = datetime.strptime(birth_date, '%Y-%m-%d')
+        if date_obj.year < 1900 or date_obj.year > 2100:
+            errors.append(f"Birth year {date_obj.year} is outside optimal range (1900-2100)")
+    except ValueError:
+        errors.append(f"Invalid date format '{birth_date}'. Use YYYY-MM-DD format")
+
+    # Validate time format
+    try:
+        datetime.strptime(birth_time, '%H:%M')
+    except ValueError:
+        errors.append(f"Invalid time format '{birth_time}'. Use HH:MM format (24-hour)")
+
+    # Validate coordinates
+    if not isinstance(latitude, (int, float)) or not (-90 <= latitude <= 90):
+        errors.append(f"Invalid latitude {latitude}. Must be between -90 and +90 degrees")
+
+    if not isinstance(longitude, (int, float)) or not (-180 <= longitude <= 180):
+        errors.append(f"Invalid longitude {longitude}. Must be between -180 and +180 degrees")
+
+    # Validate timezone
+    if timezone_str:
+        try:
+            pytz.timezone(timezone_str)
+        except pytz.exceptions.UnknownTimeZoneError:
+            errors.append(f"Invalid timezone '{timezone_str}'. Use standard timezone names like 'America/New_York'")
+
+    if errors:
+        raise ValueError(f"Input validation failed: {'; '.join(errors)}")
+
 class BirthChartService:
     """Service for generating birth charts using Prokerala API"""
     
@@ -146,38 +234,7 @@ class BirthChartService:
     
     def _validate_birth_data(self, birth_date: str, birth_time: str, latitude: float, longitude: float, timezone_str: str = None):
         """Validate birth data inputs for accuracy."""
-        errors = []
-        
-        # Validate date format
-        try:
-            date_obj = datetime.strptime(birth_date, '%Y-%m-%d')
-            if date_obj.year < 1900 or date_obj.year > 2100:
-                errors.append(f"Birth year {date_obj.year} is outside optimal range (1900-2100)")
-        except ValueError:
-            errors.append(f"Invalid date format '{birth_date}'. Use YYYY-MM-DD format")
-        
-        # Validate time format
-        try:
-            datetime.strptime(birth_time, '%H:%M')
-        except ValueError:
-            errors.append(f"Invalid time format '{birth_time}'. Use HH:MM format (24-hour)")
-        
-        # Validate coordinates
-        if not isinstance(latitude, (int, float)) or not (-90 <= latitude <= 90):
-            errors.append(f"Invalid latitude {latitude}. Must be between -90 and +90 degrees")
-        
-        if not isinstance(longitude, (int, float)) or not (-180 <= longitude <= 180):
-            errors.append(f"Invalid longitude {longitude}. Must be between -180 and +180 degrees")
-        
-        # Validate timezone
-        if timezone_str:
-            try:
-                pytz.timezone(timezone_str)
-            except pytz.exceptions.UnknownTimeZoneError:
-                errors.append(f"Invalid timezone '{timezone_str}'. Use standard timezone names like 'America/New_York'")
-        
-        if errors:
-            raise ValueError(f"Input validation failed: {'; '.join(errors)}")
+        _validate_birth_data_cached(birth_date, birth_time, latitude, longitude, timezone_str)
     
     async def generate_birth_chart(self, request: BirthChartRequest) -> BirthChartResponse:
         """Generate a comprehensive Vedic birth chart using Prokerala API."""
@@ -192,7 +249,7 @@ class BirthChartService:
         except Exception as e:
             raise ValueError(f"Error generating birth chart: {str(e)}")
 
-    def generate_detailed_report(self, request: DetailedReportRequest) -> DetailedReportResponse:
+    async def generate_detailed_report(self, request: DetailedReportRequest) -> DetailedReportResponse:
         """Generate a comprehensive detailed astrological report."""
         try:
             # First generate the birth chart
@@ -207,77 +264,37 @@ class BirthChartService:
                 ayanamsa=request.ayanamsa
             )
             
-            birth_chart = self.generate_birth_chart(birth_chart_request)
+            birth_chart = await self.generate_birth_chart(birth_chart_request)
             
-            # Generate detailed interpretations
-            personality_report = self._generate_personality_report(birth_chart)
-            career_report = self._generate_career_report(birth_chart)
-            relationship_report = self._generate_relationship_report(birth_chart)
-            health_report = self._generate_health_report(birth_chart)
-            spiritual_report = self._generate_spiritual_report(birth_chart)
+            # Generate all five interpretations in one OpenAI call; the
+            # blocking OpenAI client runs in a worker thread so the event
+            # loop stays free while the completion is in flight
+            chart_data = self._birth_chart_to_dict(birth_chart)
+            reports = await asyncio.to_thread(
+                self.openai_service.generate_all_reports, chart_data, request.name)
+            if reports is None:
+                # Template-based fallback when OpenAI is unavailable
+                reports = {
+                    "personality": self._generate_personality_report_fallback(birth_chart),
+                    "career": self._generate_career_report_fallback(birth_chart),
+                    "relationship": self._generate_relationship_report_fallback(birth_chart),
+                    "health": self._generate_health_report_fallback(birth_chart),
+                    "spiritual": self._generate_spiritual_report_fallback(birth_chart),
+                }
             
             return DetailedReportResponse(
                 name=request.name,
                 birth_chart=birth_chart,
-                personality_report=personality_report,
-                career_report=career_report,
-                relationship_report=relationship_report,
-                health_report=health_report,
-                spiritual_report=spiritual_report
+                personality_report=reports["personality"],
+                career_report=reports["career"],
+                relationship_report=reports["relationship"],
+                health_report=reports["health"],
+                spiritual_report=reports["spiritual"]
             )
             
         except Exception as e:
             raise ValueError(f"Error generating detailed report: {str(e)}")
     
-    def _generate_personality_report(self, birth_chart: BirthChartResponse) -> Dict[str, Any]:
-        """Generate personality analysis based on birth chart using OpenAI."""
-        # Convert birth chart to dictionary for OpenAI processing
-        chart_data = self._birth_chart_to_dict(birth_chart)
-        
-        # Use OpenAI service to generate the report
-        ai_report = self.openai_service.generate_astrological_report(
-            "personality", chart_data, birth_chart.name
-        )
-        
-        # If OpenAI is available, use AI-generated content
-        if self.openai_service.is_available():
-            return ai_report
-        
-        # Fallback to template-based approach
-        return self._generate_personality_report_fallback(birth_chart)
-    
-    def _generate_career_report(self, birth_chart: BirthChartResponse) -> Dict[str, Any]:
-        """Generate career and purpose analysis using OpenAI."""
-        chart_data = self._birth_chart_to_dict(birth_chart)
-        ai_report = self.openai_service.generate_astrological_report(
-            "career", chart_data, birth_chart.name
-        )
-        return ai_report if self.openai_service.is_available() else self._generate_career_report_fallback(birth_chart)
-    
-    def _generate_relationship_report(self, birth_chart: BirthChartResponse) -> Dict[str, Any]:
-        """Generate love and relationships analysis using OpenAI."""
-        chart_data = self._birth_chart_to_dict(birth_chart)
-        ai_report = self.openai_service.generate_astrological_report(
-            "relationship", chart_data, birth_chart.name
-        )
-        return ai_report if self.openai_service.is_available() else self._generate_relationship_report_fallback(birth_chart)
-    
-    def _generate_health_report(self, birth_chart: BirthChartResponse) -> Dict[str, Any]:
-        """Generate health and wellness analysis using OpenAI."""
-        chart_data = self._birth_chart_to_dict(birth_chart)
-        ai_report = self.openai_service.generate_astrological_report(
-            "health", chart_data, birth_chart.name
-        )
-        return ai_report if self.openai_service.is_available() else self._generate_health_report_fallback(birth_chart)
-    
-    def _generate_spiritual_report(self, birth_chart: BirthChartResponse) -> Dict[str, Any]:
-        """Generate spiritual and karmic analysis using OpenAI."""
-        chart_data = self._birth_chart_to_dict(birth_chart)
-        ai_report = self.openai_service.generate_astrological_report(
-            "spiritual", chart_data, birth_chart.name
-        )
-        return ai_report if self.openai_service.is_available() else self._generate_spiritual_report_fallback(birth_chart)
-    
     def _birth_chart_to_dict(self, birth_chart: BirthChartResponse) -> Dict[str, Any]:
         """Convert BirthChartResponse to dictionary for OpenAI processing."""
         return {
@@ -4,52 +4,304 @@ Calculates Vedic calendar elements and auspicious timings using pyswisseph
 """
 
 import swisseph as swe
+import copy
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 import pytz
 import math
+import time
+import numpy as np
+
+try:
+    # Optional JIT acceleration for the scalar trig kernels
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Nakshatra names
+NAKSHATRAS = (
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashirsha", "Ardra",
+    "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
+    "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
+    "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishtha", "Shatabhisha",
+    "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
+)
+
+# Tithi names
+TITHIS = (
+    "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami", "Shashthi",
+    "Saptami", "Ashtami", "Navami", "Dashami", "Ekadashi", "Dwadashi",
+    "Trayodashi", "Chaturdashi", "Purnima/Amavasya"
+)
+
+# Yoga names
+YOGAS = (
+    "Vishkumbha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda",
+    "Sukarma", "Dhriti", "Shula", "Ganda", "Vriddhi", "Dhruva",
+    "Vyaghata", "Harshana", "Vajra", "Siddhi", "Vyatipata", "Variyana",
+    "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla",
+    "Brahma", "Indra", "Vaidhriti"
+)
+
+# Karana names
+KARANAS = (
+    "Bava", "Balava", "Kaulava", "Taitila", "Gara", "Vanija", "Vishti",
+    "Shakuni", "Chatushpada", "Naga", "Kimstughna"
+)
+
+# Weekday names
+WEEKDAYS = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
+
+# Ephemeris path is process-global swisseph state: set it once at import
+# instead of per PanchangService() instance, and warm the DE file load so the
+# first user request doesn't pay the cold-start cost.
+swe.set_ephe_path('./swisseph_data')
+try:
+    swe.calc_ut(swe.julday(2000, 1, 1, 12, swe.GREG_CAL), swe.SUN, swe.FLG_SWIEPH)
+except Exception:
+    # Ephemeris files may be absent in some environments; swisseph falls
+    # back to its built-in model on first real use
+    pass
+
+# Planets used for Panchang positions, as a static (name, swisseph id)
+# sequence so the hot path doesn't rebuild a dict per call.
+# Ketu = Rahu + 180 deg and is handled specially in the loop.
+_PLANETS = (
+    ('Sun', swe.SUN),
+    ('Moon', swe.MOON),
+    ('Mars', swe.MARS),
+    ('Mercury', swe.MERCURY),
+    ('Jupiter', swe.JUPITER),
+    ('Venus', swe.VENUS),
+    ('Saturn', swe.SATURN),
+    ('Rahu', swe.MEAN_NODE),
+    ('Ketu', swe.MEAN_NODE),
+)
+
+# Zero-based Rahu Kaal period offset indexed by datetime.weekday()
+# (Mon..Sun); period numbers 7,1,6,4,5,3,2 minus one, folded here so the
+# hot path skips both the list build and the subtraction
+_RAHU_OFFSET_BY_WEEKDAY = (6, 0, 5, 3, 4, 2, 1)
+
+# Name tables as object arrays for vectorized np.take lookups
+_NAKSHATRA_ARR = np.array(NAKSHATRAS, dtype=object)
+_YOGA_ARR = np.array(YOGAS, dtype=object)
+_KARANA_ARR = np.array(KARANAS, dtype=object)
+
+# Angular spans of the Panchang elements (degrees), with reciprocals so the
+# hot path multiplies instead of divides
+NAKSHATRA_SPAN = 360.0 / 27.0
+TITHI_SPAN = 12.0
+KARANA_SPAN = 6.0
+_INV_NAKSHATRA_SPAN = 27.0 / 360.0
+_INV_PADA_SPAN = 108.0 / 360.0
+_INV_TITHI_SPAN = 1.0 / 12.0
+_INV_KARANA_SPAN = 1.0 / 6.0
+
+
+# Degree->radian conversions in the sunrise model folded into constants so
+# the kernel does one multiply-add per term instead of np.radians calls
+_TWO_PI = 2.0 * math.pi
+_ML_C0 = math.radians(280.460)        # mean longitude at epoch
+_ML_C1 = math.radians(0.9856474)      # mean longitude per-day slope
+_MA_C0 = math.radians(357.528)        # mean anomaly at epoch
+_MA_C1 = math.radians(0.9856003)      # mean anomaly per-day slope
+_EC_C1 = math.radians(1.915)          # equation-of-centre, first term
+_EC_C2 = math.radians(0.020)          # equation-of-centre, second term
+_OB_C0 = math.radians(23.439)         # mean obliquity at epoch
+_OB_C1 = math.radians(0.0000004)      # obliquity per-day slope
+_B_SLOPE = _TWO_PI / 365.0            # Spencer series day angle slope
+_SIN_REFRACTION = math.sin(math.radians(-0.8333))
+
+
+def _sunrise_sunset_model(day_of_year, latitude, longitude):
+    """Closed-form ephemeris-style sunrise/sunset in decimal hours.
+
+    Computes solar declination from the mean longitude / mean anomaly of the
+    Sun instead of the 1-term 23.45*sin(...) approximation, and corrects for
+    the equation of time and atmospheric refraction (-0.8333 deg). Written
+    with NumPy ufuncs so day_of_year may be a scalar or a 1-D array for
+    batch scanning.
+    """
+    # Solar declination via mean longitude and mean anomaly (radians)
+    mean_longitude = (_ML_C0 + _ML_C1 * day_of_year) % _TWO_PI
+    mean_anomaly = (_MA_C0 + _MA_C1 * day_of_year) % _TWO_PI
+    ecliptic_longitude = (
+        mean_longitude + _EC_C1 * np.sin(mean_anomaly) + _EC_C2 * np.sin(2.0 * mean_anomaly)
+    )
+    obliquity = _OB_C0 - _OB_C1 * day_of_year
+    declination = np.arcsin(np.sin(obliquity) * np.sin(ecliptic_longitude))
+
+    # Equation of time (Spencer series), in minutes
+    b = _B_SLOPE * (day_of_year - 1.0)
+    eot_minutes = 229.18 * (
+        0.000075
+        + 0.001868 * np.cos(b) - 0.032077 * np.sin(b)
+        - 0.014615 * np.cos(2.0 * b) - 0.040849 * np.sin(2.0 * b)
+    )
+
+    # Hour angle at rise/set with refraction + solar disc correction;
+    # clip handles polar day/night
+    lat_rad = np.radians(latitude)
+    cos_hour_angle = (
+        (_SIN_REFRACTION - np.sin(lat_rad) * np.sin(declination))
+        / (np.cos(lat_rad) * np.cos(declination))
+    )
+    hour_angle = np.degrees(np.arccos(np.clip(cos_hour_angle, -1.0, 1.0)))
+
+    # Decimal hours with longitude and equation-of-time corrections applied
+    solar_noon = 12.0 + longitude / 15.0 - eot_minutes / 60.0
+    sunrise_hour = solar_noon - hour_angle / 15.0
+    sunset_hour = solar_noon + hour_angle / 15.0
+
+    return sunrise_hour, sunset_hour
+
+
+if njit is not None:
+    _sunrise_sunset_model = njit(cache=True, fastmath=True)(_sunrise_sunset_model)
+
+
+def _panchang_numbers(sun_lon: float, moon_lon: float) -> Tuple[int, int, int, int]:
+    """Tithi/nakshatra/yoga/karana numbers for one (sun, moon) longitude pair"""
+    diff = (moon_lon - sun_lon) % 360.0
+    tithi = int(diff * _INV_TITHI_SPAN) + 1
+    nakshatra = int(moon_lon * _INV_NAKSHATRA_SPAN) + 1
+    yoga = int(((sun_lon + moon_lon) % 360.0) * _INV_NAKSHATRA_SPAN) + 1
+    karana = int(diff * _INV_KARANA_SPAN) + 1
+    return tithi, nakshatra, yoga, karana
+
+
+if njit is not None:
+    _panchang_numbers = njit(cache=True, fastmath=True)(_panchang_numbers)
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _panchang_numbers_array(sun_lon, moon_lon):
+        """Element numbers over longitude arrays for muhurat window scans"""
+        n = sun_lon.shape[0]
+        out = np.empty((4, n), dtype=np.int32)
+        for i in prange(n):
+            tithi, nakshatra, yoga, karana = _panchang_numbers(sun_lon[i], moon_lon[i])
+            out[0, i] = tithi
+            out[1, i] = nakshatra
+            out[2, i] = yoga
+            out[3, i] = karana
+        return out
+else:
+    def _panchang_numbers_array(sun_lon, moon_lon):
+        """NumPy fallback for the element-number scan when numba is absent"""
+        diff = (moon_lon - sun_lon) % 360.0
+        out = np.empty((4, sun_lon.shape[0]), dtype=np.int32)
+        out[0] = (diff * _INV_TITHI_SPAN).astype(np.int32) + 1
+        out[1] = (moon_lon * _INV_NAKSHATRA_SPAN).astype(np.int32) + 1
+        out[2] = (((sun_lon + moon_lon) % 360.0) * _INV_NAKSHATRA_SPAN).astype(np.int32) + 1
+        out[3] = (diff * _INV_KARANA_SPAN).astype(np.int32) + 1
+        return out
+
+
+# Full-result Panchang cache. A Panchang is a pure function of
+# (date, location, ayanamsa), so repeat requests - the same user refreshing,
+# or another user in the same city - are served without touching swisseph.
+# Lat/lon are rounded to 3 decimals (~100 m), plenty for muhurat timings.
+_PANCHANG_CACHE: "OrderedDict[Tuple[int, float, float, str], Dict[str, Any]]" = OrderedDict()
+_PANCHANG_CACHE_MAX = 4096
+
+
+@lru_cache(maxsize=8192)
+def _sunrise_sunset_cached(day_of_year: int, latitude: float, longitude: float) -> Tuple[float, float]:
+    """Memoized wrapper around _sunrise_sunset_model.
+
+    Pure function of its arguments, so results are cached - get_panchang
+    otherwise runs the identical trig twice (Rahu Kaal + Abhijit Muhurat).
+    """
+    return _sunrise_sunset_model(day_of_year, latitude, longitude)
+
+# Slotted result records for the calculate_* helpers: no per-instance
+# __dict__, no string hashing on construction, and FastAPI's encoder
+# serializes dataclasses directly. get_panchang converts via asdict so the
+# published JSON shape is unchanged.
+
+@dataclass(slots=True, frozen=True)
+class TithiResult:
+    tithi_number: int
+    tithi_name: str
+    paksha: str
+    progress_percent: float
+    longitude_diff: float
+
+
+@dataclass(slots=True, frozen=True)
+class NakshatraResult:
+    nakshatra_number: int
+    nakshatra_name: str
+    pada: int
+    progress_percent: float
+    longitude: float
+
+
+@dataclass(slots=True, frozen=True)
+class YogaResult:
+    yoga_number: int
+    yoga_name: str
+    progress_percent: float
+    longitude_sum: float
+
+
+@dataclass(slots=True, frozen=True)
+class KaranaResult:
+    karana_number: int
+    karana_name: str
+    progress_percent: float
+
+
+@dataclass(slots=True, frozen=True)
+class RahuKaalResult:
+    rahu_kaal_start: str
+    rahu_kaal_end: str
+    duration_minutes: int
+    sunrise: str
+    sunset: str
+    day_duration_hours: float
+    error: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class AbhijitResult:
+    abhijit_start: str
+    abhijit_end: str
+    duration_minutes: int
+    description: str
+    error: Optional[str] = None
+
 
 class PanchangService:
     """Service for calculating Panchang elements and Muhurats"""
     
     def __init__(self):
         """Initialize the Panchang service"""
-        # Set ephemeris path
-        swe.set_ephe_path('./swisseph_data')
-        
-        # Nakshatra names
-        self.nakshatras = [
-            "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashirsha", "Ardra",
-            "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
-            "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
-            "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishtha", "Shatabhisha",
-            "Purva Bhadrapada", "Uttara Bhadrapada", "Revati"
-        ]
-        
-        # Tithi names
-        self.tithis = [
-            "Pratipada", "Dwitiya", "Tritiya", "Chaturthi", "Panchami", "Shashthi",
-            "Saptami", "Ashtami", "Navami", "Dashami", "Ekadashi", "Dwadashi",
-            "Trayodashi", "Chaturdashi", "Purnima/Amavasya"
-        ]
-        
-        # Yoga names
-        self.yogas = [
-            "Vishkumbha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda",
-            "Sukarma", "Dhriti", "Shula", "Ganda", "Vriddhi", "Dhruva",
-            "Vyaghata", "Harshana", "Vajra", "Siddhi", "Vyatipata", "Variyana",
-            "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha", "Shukla",
-            "Brahma", "Indra", "Vaidhriti"
-        ]
-        
-        # Karana names
-        self.karanas = [
-            "Bava", "Balava", "Kaulava", "Taitila", "Gara", "Vanija", "Vishti",
-            "Shakuni", "Chatushpada", "Naga", "Kimstughna"
-        ]
-        
-        # Weekday names
-        self.weekdays = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+        # Name tables live at module level as immutable tuples; the instance
+        # attributes are kept for API consumers (e.g. the /nakshatras route)
+        self.nakshatras = NAKSHATRAS
+        self.tithis = TITHIS
+        self.yogas = YOGAS
+        self.karanas = KARANAS
+        self.weekdays = WEEKDAYS
+
+        # Name indexed directly by datetime.weekday() (Monday=0 ... Sunday=6)
+        self._weekday_map = tuple(WEEKDAYS[(i + 1) % 7] for i in range(7))
+
+        # Last sidereal mode passed to swe.set_sid_mode, to skip redundant calls
+        self._current_sid_mode = None
+
+        # Sunrise/sunset datetimes per (date, tz, location) - both muhurat
+        # methods and repeat requests share one swe.rise_trans result.
+        # LRU-bounded like _PANCHANG_CACHE so arbitrary coordinates can't
+        # grow it without limit over a long-lived process
+        self._sun_times_cache: "OrderedDict[Tuple, Tuple[datetime, datetime]]" = OrderedDict()
+        self._sun_times_cache_max = 4096
         
     def julian_day_from_datetime(self, dt: datetime) -> float:
         """Convert datetime to Julian Day Number"""
@@ -76,46 +328,41 @@ class PanchangService:
             "Yukteshwar": swe.SIDM_YUKTESHWAR
         }
         
-        swe.set_sid_mode(ayanamsa_map.get(ayanamsa_type, swe.SIDM_LAHIRI))
+        mode = ayanamsa_map.get(ayanamsa_type, swe.SIDM_LAHIRI)
+        if mode != self._current_sid_mode:
+            swe.set_sid_mode(mode)
+            self._current_sid_mode = mode
         return swe.get_ayanamsa(jd)
     
     def calculate_planetary_positions(self, jd: float, ayanamsa: float) -> Dict[str, Dict[str, float]]:
         """Calculate sidereal positions of planets"""
-        planets = {
-            'Sun': swe.SUN,
-            'Moon': swe.MOON,
-            'Mars': swe.MARS,
-            'Mercury': swe.MERCURY,
-            'Jupiter': swe.JUPITER,
-            'Venus': swe.VENUS,
-            'Saturn': swe.SATURN,
-            'Rahu': swe.MEAN_NODE,
-            'Ketu': swe.MEAN_NODE  # Ketu = Rahu + 180°
-        }
-        
         positions = {}
-        
-        for planet_name, planet_id in planets.items():
-            try:
+        flag = swe.FLG_SWIEPH
+
+        try:
+            for planet_name, planet_id in _PLANETS:
                 # Calculate tropical position
-                result = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH)
+                result = swe.calc_ut(jd, planet_id, flag)
                 tropical_longitude = result[0][0]
-                
+
                 # Convert to sidereal
                 if planet_name == 'Ketu':
                     sidereal_longitude = (tropical_longitude + 180 - ayanamsa) % 360
                 else:
                     sidereal_longitude = (tropical_longitude - ayanamsa) % 360
-                
+
                 positions[planet_name] = {
                     'longitude': sidereal_longitude,
                     'tropical': tropical_longitude
                 }
-                
-            except Exception as e:
-                print(f"Error calculating {planet_name}: {e}")
-                positions[planet_name] = {'longitude': 0, 'tropical': 0}
-        
+
+        except Exception as e:
+            # One outer handler instead of a try/except per planet; zero-fill
+            # whatever swisseph could not deliver so downstream keys exist
+            print(f"Error calculating planetary positions: {e}")
+            for planet_name, _ in _PLANETS:
+                positions.setdefault(planet_name, {'longitude': 0, 'tropical': 0})
+
         return positions
     
     def calculate_tithi(self, sun_longitude: float, moon_longitude: float) -> Dict[str, Any]:
@@ -124,8 +371,8 @@ class PanchangService:
         longitude_diff = (moon_longitude - sun_longitude) % 360
         
         # Each tithi spans 12 degrees
-        tithi_number = int(longitude_diff / 12) + 1
-        tithi_progress = (longitude_diff % 12) / 12 * 100
+        tithi_number = int(longitude_diff * _INV_TITHI_SPAN) + 1
+        tithi_progress = (longitude_diff % TITHI_SPAN) * _INV_TITHI_SPAN * 100
         
         # Determine if it's Krishna Paksha or Shukla Paksha
         if tithi_number <= 15:
@@ -136,34 +383,33 @@ class PanchangService:
             krishna_tithi = tithi_number - 15
             tithi_name = self.tithis[krishna_tithi - 1] if krishna_tithi <= 14 else "Amavasya"
         
-        return {
-            'tithi_number': tithi_number,
-            'tithi_name': tithi_name,
-            'paksha': paksha,
-            'progress_percent': round(tithi_progress, 2),
-            'longitude_diff': round(longitude_diff, 4)
-        }
+        return TithiResult(
+            tithi_number=tithi_number,
+            tithi_name=tithi_name,
+            paksha=paksha,
+            progress_percent=round(tithi_progress, 2),
+            longitude_diff=round(longitude_diff, 4)
+        )
     
     def calculate_nakshatra(self, moon_longitude: float) -> Dict[str, Any]:
         """Calculate Nakshatra (Constellation)"""
         # Each nakshatra spans 13°20' (800 minutes of arc)
-        nakshatra_span = 360 / 27  # 13.333...°
-        
-        nakshatra_number = int(moon_longitude / nakshatra_span) + 1
-        nakshatra_progress = (moon_longitude % nakshatra_span) / nakshatra_span * 100
-        
+        nakshatra_number = int(moon_longitude * _INV_NAKSHATRA_SPAN) + 1
+        in_nakshatra = moon_longitude % NAKSHATRA_SPAN
+        nakshatra_progress = in_nakshatra * _INV_NAKSHATRA_SPAN * 100
+
         # Nakshatra pada (quarter)
-        pada_number = int((moon_longitude % nakshatra_span) / (nakshatra_span / 4)) + 1
+        pada_number = int(in_nakshatra * _INV_PADA_SPAN) + 1
         
         nakshatra_name = self.nakshatras[nakshatra_number - 1]
         
-        return {
-            'nakshatra_number': nakshatra_number,
-            'nakshatra_name': nakshatra_name,
-            'pada': pada_number,
-            'progress_percent': round(nakshatra_progress, 2),
-            'longitude': round(moon_longitude, 4)
-        }
+        return NakshatraResult(
+            nakshatra_number=nakshatra_number,
+            nakshatra_name=nakshatra_name,
+            pada=pada_number,
+            progress_percent=round(nakshatra_progress, 2),
+            longitude=round(moon_longitude, 4)
+        )
     
     def calculate_yoga(self, sun_longitude: float, moon_longitude: float) -> Dict[str, Any]:
         """Calculate Yoga"""
@@ -171,174 +417,160 @@ class PanchangService:
         yoga_longitude = (sun_longitude + moon_longitude) % 360
         
         # Each yoga spans 13°20' (same as nakshatra)
-        yoga_span = 360 / 27
-        yoga_number = int(yoga_longitude / yoga_span) + 1
-        yoga_progress = (yoga_longitude % yoga_span) / yoga_span * 100
+        yoga_number = int(yoga_longitude * _INV_NAKSHATRA_SPAN) + 1
+        yoga_progress = (yoga_longitude % NAKSHATRA_SPAN) * _INV_NAKSHATRA_SPAN * 100
         
         yoga_name = self.yogas[yoga_number - 1]
         
-        return {
-            'yoga_number': yoga_number,
-            'yoga_name': yoga_name,
-            'progress_percent': round(yoga_progress, 2),
-            'longitude_sum': round(yoga_longitude, 4)
-        }
+        return YogaResult(
+            yoga_number=yoga_number,
+            yoga_name=yoga_name,
+            progress_percent=round(yoga_progress, 2),
+            longitude_sum=round(yoga_longitude, 4)
+        )
     
     def calculate_karana(self, sun_longitude: float, moon_longitude: float) -> Dict[str, Any]:
         """Calculate Karana (Half Tithi)"""
         longitude_diff = (moon_longitude - sun_longitude) % 360
         
         # Each karana spans 6 degrees (half of tithi)
-        karana_number = int(longitude_diff / 6) + 1
-        karana_progress = (longitude_diff % 6) / 6 * 100
-        
-        # Karana follows a specific pattern
-        if karana_number <= 7:
-            karana_name = self.karanas[karana_number - 1]
-        elif karana_number <= 14:
-            karana_name = self.karanas[(karana_number - 8) % 7]
-        elif karana_number <= 21:
-            karana_name = self.karanas[(karana_number - 15) % 7]
-        elif karana_number <= 28:
-            karana_name = self.karanas[(karana_number - 22) % 7]
-        elif karana_number <= 35:
-            karana_name = self.karanas[(karana_number - 29) % 7]
-        elif karana_number <= 42:
-            karana_name = self.karanas[(karana_number - 36) % 7]
-        elif karana_number <= 49:
-            karana_name = self.karanas[(karana_number - 43) % 7]
-        elif karana_number <= 56:
-            karana_name = self.karanas[(karana_number - 50) % 7]
+        karana_number = int(longitude_diff * _INV_KARANA_SPAN) + 1
+        karana_progress = (longitude_diff % KARANA_SPAN) * _INV_KARANA_SPAN * 100
+        
+        # Karana follows a specific pattern: the seven movable karanas
+        # repeat through number 56, then the four fixed ones (Shakuni,
+        # Chatushpada, Naga, Kimstughna) occupy 57-60
+        if karana_number <= 56:
+            karana_name = self.karanas[(karana_number - 1) % 7]
         else:
-            # Fixed karanas
-            if karana_number == 57:
-                karana_name = self.karanas[7]  # Shakuni
-            elif karana_number == 58:
-                karana_name = self.karanas[8]  # Chatushpada
-            elif karana_number == 59:
-                karana_name = self.karanas[9]  # Naga
-            else:
-                karana_name = self.karanas[10]  # Kimstughna
+            karana_name = self.karanas[karana_number - 57 + 7]
         
+        return KaranaResult(
+            karana_number=karana_number,
+            karana_name=karana_name,
+            progress_percent=round(karana_progress, 2)
+        )
+    
+    def calculate_panchang_elements_vec(self, sun_lon: np.ndarray, moon_lon: np.ndarray) -> Dict[str, np.ndarray]:
+        """Vectorized Tithi/Nakshatra/Yoga/Karana over arrays of longitudes.
+
+        One NumPy pass replaces hundreds of scalar calculate_* calls when
+        sweeping a time grid for muhurat windows (e.g. every 15 minutes
+        through a day looking for a Nakshatra transition).
+        """
+        sun_lon = np.ascontiguousarray(sun_lon, dtype=np.float64)
+        moon_lon = np.ascontiguousarray(moon_lon, dtype=np.float64)
+
+        numbers = _panchang_numbers_array(sun_lon, moon_lon)
+        tithi_number, nakshatra_number, yoga_number, karana_number = numbers
+
+        # Same mapping as calculate_karana: movable karanas cycle through
+        # 1-56, the four fixed ones occupy 57-60 at indices 7-10
+        karana_index = np.where(
+            karana_number <= 56, (karana_number - 1) % 7, karana_number - 57 + 7
+        )
+
         return {
+            'tithi_number': tithi_number,
+            'nakshatra_number': nakshatra_number,
+            'yoga_number': yoga_number,
             'karana_number': karana_number,
-            'karana_name': karana_name,
-            'progress_percent': round(karana_progress, 2)
+            'nakshatra_name': np.take(_NAKSHATRA_ARR, nakshatra_number - 1),
+            'yoga_name': np.take(_YOGA_ARR, yoga_number - 1),
+            'karana_name': np.take(_KARANA_ARR, karana_index),
         }
-    
+
+    def _sunrise_sunset_datetimes(self, date: datetime, latitude: float, longitude: float) -> Tuple[datetime, datetime]:
+        """Sunrise and sunset datetimes for a date and location.
+
+        Uses swe.rise_trans (C-level, accounts for equation of time and
+        refraction) with the closed-form model as fallback. Results are
+        cached per (date, tz, location) since both muhurat methods need
+        the same pair.
+        """
+        cache_key = (date.toordinal(), str(date.tzinfo), round(latitude, 4), round(longitude, 4))
+        cached = self._sun_times_cache.get(cache_key)
+        if cached is not None:
+            self._sun_times_cache.move_to_end(cache_key)
+            return cached
+
+        midnight = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        try:
+            jd = self.julian_day_from_datetime(midnight)
+            geopos = (longitude, latitude, 0.0)
+            # rise_trans signals "no rise/set today" (circumpolar dates)
+            # with a nonzero retflag and zeroed tret rather than raising,
+            # so the flag has to be checked explicitly
+            res, tret = swe.rise_trans(
+                jd, swe.SUN, rsmi=swe.CALC_RISE | swe.BIT_DISC_CENTER, geopos=geopos
+            )
+            if res != 0 or tret[0] == 0:
+                raise ValueError("no sunrise for this date/location")
+            sunrise_dt = self.jd_to_datetime(tret[0], tzinfo=date.tzinfo)
+            res, tret = swe.rise_trans(
+                jd, swe.SUN, rsmi=swe.CALC_SET | swe.BIT_DISC_CENTER, geopos=geopos
+            )
+            if res != 0 or tret[0] == 0:
+                raise ValueError("no sunset for this date/location")
+            sunset_dt = self.jd_to_datetime(tret[0], tzinfo=date.tzinfo)
+        except Exception:
+            # Polar day/night or missing ephemeris files: fall back to the
+            # closed-form model; timedelta arithmetic keeps out-of-range
+            # decimal hours from crashing date.replace
+            sunrise_hour, sunset_hour = _sunrise_sunset_cached(
+                date.timetuple().tm_yday, round(latitude, 4), round(longitude, 4)
+            )
+            sunrise_dt = midnight + timedelta(hours=float(sunrise_hour))
+            sunset_dt = midnight + timedelta(hours=float(sunset_hour))
+
+        self._sun_times_cache[cache_key] = (sunrise_dt, sunset_dt)
+        if len(self._sun_times_cache) > self._sun_times_cache_max:
+            self._sun_times_cache.popitem(last=False)
+        return sunrise_dt, sunset_dt
+
     def calculate_rahu_kaal(self, date: datetime, latitude: float, longitude: float) -> Dict[str, Any]:
-        """Calculate Rahu Kaal timings using approximate sunrise/sunset"""
+        """Calculate Rahu Kaal timings from ephemeris sunrise/sunset"""
         try:
-            # Approximate sunrise and sunset calculation
-            # This is a simplified method that's more reliable than Swiss Ephemeris for this purpose
-            
-            # Get day of year
-            day_of_year = date.timetuple().tm_yday
-            
-            # Calculate declination of sun (approximate)
-            P = 23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
-            
-            # Calculate sunrise and sunset times (approximate)
-            lat_rad = math.radians(latitude)
-            argument = -math.tan(lat_rad) * math.tan(math.radians(P))
-            
-            # Handle polar regions
-            if argument < -1:
-                argument = -1
-            elif argument > 1:
-                argument = 1
-                
-            hour_angle = math.degrees(math.acos(argument))
-            
-            # Calculate sunrise and sunset in decimal hours
-            sunrise_hour = 12 - hour_angle / 15
-            sunset_hour = 12 + hour_angle / 15
-            
-            # Apply longitude correction
-            longitude_correction = longitude / 15
-            sunrise_hour += longitude_correction
-            sunset_hour += longitude_correction
-            
-            # Convert to datetime
-            sunrise_dt = date.replace(hour=int(sunrise_hour), 
-                                    minute=int((sunrise_hour % 1) * 60),
-                                    second=0, microsecond=0)
-            sunset_dt = date.replace(hour=int(sunset_hour), 
-                                   minute=int((sunset_hour % 1) * 60),
-                                   second=0, microsecond=0)
-            
+            sunrise_dt, sunset_dt = self._sunrise_sunset_datetimes(date, latitude, longitude)
+
             # Calculate day duration
             day_duration = sunset_dt - sunrise_dt
             rahu_kaal_duration = day_duration / 8  # Rahu Kaal is 1/8th of day
             
-            # Rahu Kaal timing based on weekday
-            weekday = date.weekday()  # 0=Monday, 6=Sunday
-            weekday_rahu_order = [7, 1, 6, 4, 5, 3, 2]  # Mon, Tue, Wed, Thu, Fri, Sat, Sun
-            rahu_period = weekday_rahu_order[weekday]
-            
+            # Rahu Kaal timing based on weekday (0=Monday, 6=Sunday)
+            rahu_offset = _RAHU_OFFSET_BY_WEEKDAY[date.weekday()]
+
             # Calculate Rahu Kaal start time
-            rahu_start = sunrise_dt + (rahu_period - 1) * rahu_kaal_duration
+            rahu_start = sunrise_dt + rahu_offset * rahu_kaal_duration
             rahu_end = rahu_start + rahu_kaal_duration
             
-            return {
-                'rahu_kaal_start': rahu_start.strftime('%H:%M'),
-                'rahu_kaal_end': rahu_end.strftime('%H:%M'),
-                'duration_minutes': int(rahu_kaal_duration.total_seconds() / 60),
-                'sunrise': sunrise_dt.strftime('%H:%M'),
-                'sunset': sunset_dt.strftime('%H:%M'),
-                'day_duration_hours': round(day_duration.total_seconds() / 3600, 2)
-            }
+            return RahuKaalResult(
+                rahu_kaal_start=f"{rahu_start.hour:02d}:{rahu_start.minute:02d}",
+                rahu_kaal_end=f"{rahu_end.hour:02d}:{rahu_end.minute:02d}",
+                duration_minutes=int(rahu_kaal_duration.total_seconds() / 60),
+                sunrise=f"{sunrise_dt.hour:02d}:{sunrise_dt.minute:02d}",
+                sunset=f"{sunset_dt.hour:02d}:{sunset_dt.minute:02d}",
+                day_duration_hours=round(day_duration.total_seconds() / 3600, 2)
+            )
             
         except Exception as e:
             print(f"Error calculating Rahu Kaal: {e}")
-            return {
-                'rahu_kaal_start': 'N/A',
-                'rahu_kaal_end': 'N/A',
-                'duration_minutes': 0,
-                'sunrise': 'N/A',
-                'sunset': 'N/A',
-                'day_duration_hours': 0,
-                'error': str(e)
-            }
+            return RahuKaalResult(
+                rahu_kaal_start='N/A',
+                rahu_kaal_end='N/A',
+                duration_minutes=0,
+                sunrise='N/A',
+                sunset='N/A',
+                day_duration_hours=0,
+                error=str(e)
+            )
     
     def calculate_abhijit_muhurat(self, date: datetime, latitude: float, longitude: float) -> Dict[str, Any]:
-        """Calculate Abhijit Muhurat (most auspicious time) using approximate sunrise/sunset"""
+        """Calculate Abhijit Muhurat (most auspicious time) from ephemeris sunrise/sunset"""
         try:
-            # Use the same approximate calculation as Rahu Kaal
-            day_of_year = date.timetuple().tm_yday
-            
-            # Calculate declination of sun (approximate)
-            P = 23.45 * math.sin(math.radians(360 * (284 + day_of_year) / 365))
-            
-            # Calculate sunrise and sunset times (approximate)
-            lat_rad = math.radians(latitude)
-            argument = -math.tan(lat_rad) * math.tan(math.radians(P))
-            
-            # Handle polar regions
-            if argument < -1:
-                argument = -1
-            elif argument > 1:
-                argument = 1
-                
-            hour_angle = math.degrees(math.acos(argument))
-            
-            # Calculate sunrise and sunset in decimal hours
-            sunrise_hour = 12 - hour_angle / 15
-            sunset_hour = 12 + hour_angle / 15
-            
-            # Apply longitude correction
-            longitude_correction = longitude / 15
-            sunrise_hour += longitude_correction
-            sunset_hour += longitude_correction
-            
-            # Convert to datetime
-            sunrise_dt = date.replace(hour=int(sunrise_hour), 
-                                    minute=int((sunrise_hour % 1) * 60),
-                                    second=0, microsecond=0)
-            sunset_dt = date.replace(hour=int(sunset_hour), 
-                                   minute=int((sunset_hour % 1) * 60),
-                                   second=0, microsecond=0)
-            
+            # Same cached sunrise/sunset pair as Rahu Kaal
+            sunrise_dt, sunset_dt = self._sunrise_sunset_datetimes(date, latitude, longitude)
+
             # Abhijit muhurat is the 8th muhurat (middle of the day)
             day_duration = sunset_dt - sunrise_dt
             muhurat_duration = day_duration / 15  # Day divided into 15 muhurats
@@ -347,40 +579,40 @@ class PanchangService:
             abhijit_start = sunrise_dt + 7 * muhurat_duration
             abhijit_end = abhijit_start + muhurat_duration
             
-            return {
-                'abhijit_start': abhijit_start.strftime('%H:%M'),
-                'abhijit_end': abhijit_end.strftime('%H:%M'),
-                'duration_minutes': int(muhurat_duration.total_seconds() / 60),
-                'description': 'Most auspicious time for starting new ventures'
-            }
+            return AbhijitResult(
+                abhijit_start=f"{abhijit_start.hour:02d}:{abhijit_start.minute:02d}",
+                abhijit_end=f"{abhijit_end.hour:02d}:{abhijit_end.minute:02d}",
+                duration_minutes=int(muhurat_duration.total_seconds() / 60),
+                description='Most auspicious time for starting new ventures'
+            )
             
         except Exception as e:
-            return {
-                'abhijit_start': 'N/A',
-                'abhijit_end': 'N/A',
-                'duration_minutes': 0,
-                'description': 'Error calculating Abhijit muhurat',
-                'error': str(e)
-            }
+            return AbhijitResult(
+                abhijit_start='N/A',
+                abhijit_end='N/A',
+                duration_minutes=0,
+                description='Error calculating Abhijit muhurat',
+                error=str(e)
+            )
     
     def jd_to_datetime(self, jd: float, tzinfo=None) -> datetime:
         """Convert Julian Day to datetime"""
         try:
-            year, month, day, hour = swe.jdut1_to_utc(jd, swe.GREG_CAL)
+            # jdut1_to_utc returns six fields; seconds carry the fraction
+            year, month, day, hours, minutes, seconds_float = swe.jdut1_to_utc(jd, swe.GREG_CAL)
             
-            # Extract hours, minutes, seconds properly
-            hours = int(hour)
-            minutes_float = (hour - hours) * 60
-            minutes = int(minutes_float)
-            seconds_float = (minutes_float - minutes) * 60
             seconds = int(seconds_float)
+            microseconds = int(round((seconds_float - seconds) * 1e6))
+            if microseconds >= 1000000:
+                microseconds -= 1000000
+                seconds += 1
             
             # Ensure values are within valid ranges
-            hours = max(0, min(23, hours))
-            minutes = max(0, min(59, minutes))
+            hours = max(0, min(23, int(hours)))
+            minutes = max(0, min(59, int(minutes)))
             seconds = max(0, min(59, seconds))
             
-            dt = datetime(int(year), int(month), int(day), hours, minutes, seconds)
+            dt = datetime(int(year), int(month), int(day), hours, minutes, seconds, microseconds)
             
             if tzinfo:
                 dt = dt.replace(tzinfo=timezone.utc).astimezone(tzinfo)
@@ -395,7 +627,17 @@ class PanchangService:
     def get_panchang(self, date: datetime, latitude: float, longitude: float, 
                     ayanamsa_type: str = "Lahiri") -> Dict[str, Any]:
         """Calculate complete Panchang for a given date and location"""
-        
+
+        # Serve repeat (date, location, ayanamsa) requests from the cache.
+        # The timezone is part of the key — muhurat timings are local times,
+        # so the same calendar date in IST and UTC are different results.
+        cache_key = (date.toordinal(), str(date.tzinfo), round(latitude, 3),
+                     round(longitude, 3), ayanamsa_type)
+        cached = _PANCHANG_CACHE.get(cache_key)
+        if cached is not None:
+            _PANCHANG_CACHE.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+
         # Convert to Julian Day
         jd = self.julian_day_from_datetime(date)
         
@@ -419,14 +661,10 @@ class PanchangService:
         abhijit = self.calculate_abhijit_muhurat(date, latitude, longitude)
         
         # Weekday
-        weekday = self.weekdays[date.weekday() if date.weekday() != 6 else 0]
-        if date.weekday() == 6:  # Sunday
-            weekday = self.weekdays[0]
-        else:
-            weekday = self.weekdays[date.weekday() + 1]
-        
-        return {
-            'date': date.strftime('%Y-%m-%d'),
+        weekday = self._weekday_map[date.weekday()]
+
+        result = {
+            'date': f"{date.year:04d}-{date.month:02d}-{date.day:02d}",
             'location': {
                 'latitude': latitude,
                 'longitude': longitude
@@ -436,17 +674,27 @@ class PanchangService:
                 'type': ayanamsa_type,
                 'value': round(ayanamsa, 6)
             },
-            'tithi': tithi,
-            'nakshatra': nakshatra,
-            'yoga': yoga,
-            'karana': karana,
+            'tithi': asdict(tithi),
+            'nakshatra': asdict(nakshatra),
+            'yoga': asdict(yoga),
+            'karana': asdict(karana),
             'planetary_positions': {
                 'sun': round(sun_longitude, 4),
                 'moon': round(moon_longitude, 4)
             },
             'muhurats': {
-                'rahu_kaal': rahu_kaal,
-                'abhijit': abhijit
+                'rahu_kaal': asdict(rahu_kaal),
+                'abhijit': asdict(abhijit)
             },
-            'timestamp': datetime.now().isoformat()
-        } 
\ No newline at end of file
+            # ISO8601 timestamp without the local-timezone database lookup
+            # that datetime.now() performs on every call
+            'timestamp': datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
+        }
+
+        # Deep-copy in and out so callers mutating their result can't
+        # corrupt the cached entry
+        _PANCHANG_CACHE[cache_key] = copy.deepcopy(result)
+        if len(_PANCHANG_CACHE) > _PANCHANG_CACHE_MAX:
+            _PANCHANG_CACHE.popitem(last=False)
+
+        return result 
\ No newline at end of file
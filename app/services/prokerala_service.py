@@ -3,10 +3,15 @@ Prokerala API Service for Vedic Astrology Calculations
 """
 
 import os
+import asyncio
 import base64
-import requests
-from datetime import datetime
-from typing import Dict, Any, Optional
+import logging
+import time
+import httpx
+import orjson
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 
 from app.models import (
@@ -17,170 +22,218 @@ from app.models import (
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Map Vedic rasi names to our zodiac signs. Built once at import, together
+# with direct name->enum tables, so the per-planet conversion is plain dict
+# lookups with no enum __getitem__ machinery.
+RASI_MAP = {
+    "Mesha": "ARIES",
+    "Vrishabha": "TAURUS",
+    "Mithuna": "GEMINI",
+    "Karka": "CANCER",
+    "Simha": "LEO",
+    "Kanya": "VIRGO",
+    "Tula": "LIBRA",
+    "Vrischika": "SCORPIO",
+    "Dhanu": "SAGITTARIUS",
+    "Makara": "CAPRICORN",
+    "Kumbha": "AQUARIUS",
+    "Meena": "PISCES"
+}
+RASI_TO_ZODIAC = {name: ZodiacSign[value] for name, value in RASI_MAP.items()}
+ZODIAC_BY_UPPER = {sign.name: sign for sign in ZodiacSign}
+PLANET_BY_UPPER = {planet.name: planet for planet in Planet}
+
+# Prokerala expects IST timestamps; a cached tzinfo plus C-level
+# fromisoformat/isoformat replaces the strptime/strftime format-string
+# interpretation previously done per request
+IST = timezone(timedelta(hours=5, minutes=30))
+
 class ProkeralaService:
     """Service for interacting with Prokerala's Astrology API"""
     
     def __init__(self):
         self.client_id = os.getenv("PROKERALA_CLIENT_ID")
         self.client_secret = os.getenv("PROKERALA_CLIENT_SECRET")
-        self.debug = True  # Force debug mode on
+        self.debug = False  # Verbose tracing now goes through logger.debug
         self.base_url = "https://api.prokerala.com/v2/astrology"
         self.access_token = None
+
+        # Proactive token refresh state: expiry deadline on the monotonic
+        # clock and a single-flight lock so N concurrent callers hitting an
+        # expired token trigger one fetch, not N
+        self._token_expiry: float = 0.0
+        self._token_lock = asyncio.Lock()
+
+        # Basic auth header is a pure function of the credentials; encode
+        # it once instead of base64-encoding on every token refresh
+        credentials = f"{self.client_id}:{self.client_secret}"
+        self._basic_auth = "Basic " + base64.b64encode(credentials.encode()).decode()
+
+        # Parsed JSON responses keyed by (endpoint, params): identical chart
+        # calls skip both the network round trip and json.loads
+        self._response_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._response_cache_max = 256
+
+        # Fully-built chart responses keyed by the canonical birth inputs;
+        # a hit skips the HTTP round trip, conversion loops and Pydantic
+        # validation entirely. Entries expire after an hour.
+        self._chart_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._chart_cache_max = 1024
+        self._chart_cache_ttl = 3600.0
+
+        # Shared async client with keep-alive pooling: blocking requests
+        # calls stalled the event loop and serialized all Prokerala traffic,
+        # while one pooled client reuses a single TLS connection across
+        # concurrent chart requests
+        # HTTP/2 lets the token, planet-position and chart calls multiplex
+        # over one TLS connection, and advertising gzip/brotli shrinks the
+        # JSON payloads 5-10x on the wire (httpx decodes transparently)
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            headers={"Accept": "application/json", "Accept-Encoding": "gzip, br"}
+        )
+
+    async def aclose(self):
+        """Close the pooled HTTP client"""
+        await self.client.aclose()
         
-    def _get_access_token(self) -> str:
-        """Get OAuth access token from Prokerala"""
-        if not self.access_token:
+    def _token_fresh(self) -> bool:
+        """Whether the cached token is still valid with a 60s safety margin"""
+        return bool(self.access_token) and time.monotonic() < self._token_expiry - 60
+
+    async def _get_access_token(self) -> str:
+        """Get OAuth access token from Prokerala, refreshing before expiry"""
+        if self._token_fresh():
+            return self.access_token
+
+        async with self._token_lock:
+            # Another coroutine may have refreshed while we waited
+            if self._token_fresh():
+                return self.access_token
+
             auth_url = "https://api.prokerala.com/token"
             
-            # Create base64 encoded credentials
-            credentials = f"{self.client_id}:{self.client_secret}"
-            encoded_credentials = base64.b64encode(credentials.encode()).decode()
-            
             headers = {
                 "Content-Type": "application/x-www-form-urlencoded",
-                "Authorization": f"Basic {encoded_credentials}"
+                "Authorization": self._basic_auth
             }
             
-            if self.debug:
-                print("\n=== DEBUG: Token Request ===")
-                print(f"Token Request URL: {auth_url}")
-                print(f"Token Request Headers:")
-                for key, value in headers.items():
-                    print(f"  {key}: {value}")
-                print("Token Request Data:")
-                print(f"  grant_type=client_credentials")
-                print("=== END Token Request ===\n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Token request url=%s headers=%s data=grant_type=client_credentials",
+                             auth_url, headers)
             
-            response = requests.post(auth_url, headers=headers, data={
+            response = await self.client.post(auth_url, headers=headers, data={
                 "grant_type": "client_credentials"
             })
             
-            if self.debug:
-                print("\n=== DEBUG: Token Response ===")
-                print(f"Response Status: {response.status_code}")
-                print(f"Response Headers:")
-                for key, value in response.headers.items():
-                    print(f"  {key}: {value}")
-                print(f"Response Body: {response.text}")
-                print("=== END Token Response ===\n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Token response status=%s headers=%s body=%s",
+                             response.status_code, response.headers, response.text)
             
             response.raise_for_status()
-            self.access_token = response.json()["access_token"]
+            token_data = orjson.loads(response.content)
+            self.access_token = token_data["access_token"]
+            self._token_expiry = time.monotonic() + float(token_data.get("expires_in", 3600))
         return self.access_token
     
-    def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Make authenticated request to Prokerala API"""
+        cache_key = (endpoint, frozenset(params.items()))
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return cached
+
         headers = {
-            "Authorization": f"Bearer {self._get_access_token()}",
+            "Authorization": f"Bearer {await self._get_access_token()}",
             "Accept": "application/json"
         }
         
         url = f"{self.base_url}/{endpoint}"
         
-        if self.debug:
-            print("\n=== DEBUG: API Request ===")
-            print(f"URL: {url}")
-            print("Headers:")
-            for key, value in headers.items():
-                print(f"  {key}: {value}")
-            print("Parameters:")
-            for key, value in params.items():
-                print(f"  {key}: {value}")
-            print("=== END API Request ===\n")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API request url=%s headers=%s params=%s", url, headers, params)
         
-        response = requests.get(url, headers=headers, params=params)
+        response = await self.client.get(url, headers=headers, params=params)
         
-        if self.debug:
-            print("\n=== DEBUG: API Response ===")
-            print(f"Full URL: {response.url}")
-            print(f"Status Code: {response.status_code}")
-            print("Response Headers:")
-            for key, value in response.headers.items():
-                print(f"  {key}: {value}")
-            print(f"Response Body: {response.text}")
-            print("=== END API Response ===\n")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API response url=%s status=%s headers=%s body=%s",
+                         response.url, response.status_code, response.headers, response.text)
         
         # Handle token expiration
         if response.status_code == 401:
-            print("Token expired, refreshing...")
+            logger.info("Token expired, refreshing...")
             self.access_token = None  # Clear the cached token
+            self._token_expiry = 0.0
             # Retry with fresh token
-            headers["Authorization"] = f"Bearer {self._get_access_token()}"
-            response = requests.get(url, headers=headers, params=params)
+            headers["Authorization"] = f"Bearer {await self._get_access_token()}"
+            response = await self.client.get(url, headers=headers, params=params)
             
-            if self.debug:
-                print("\n=== DEBUG: Retry API Response ===")
-                print(f"Status Code: {response.status_code}")
-                print(f"Response Body: {response.text}")
-                print("=== END Retry API Response ===\n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Retry API response status=%s body=%s",
+                             response.status_code, response.text)
         
         response.raise_for_status()
-        return response.json()
+        # orjson parses the planet-position payload ~3-5x faster than the
+        # stdlib json used by response.json(), straight from the bytes
+        result = orjson.loads(response.content)
+
+        self._response_cache[cache_key] = result
+        if len(self._response_cache) > self._response_cache_max:
+            self._response_cache.popitem(last=False)
+
+        return result
     
     def _convert_planet_position(self, planet_data: Dict[str, Any]) -> PlanetPosition:
         """Convert Prokerala planet data to our PlanetPosition model"""
-        # Map Vedic rasi names to our zodiac signs
-        rasi_map = {
-            "Mesha": "ARIES",
-            "Vrishabha": "TAURUS",
-            "Mithuna": "GEMINI",
-            "Karka": "CANCER",
-            "Simha": "LEO",
-            "Kanya": "VIRGO",
-            "Tula": "LIBRA",
-            "Vrischika": "SCORPIO",
-            "Dhanu": "SAGITTARIUS",
-            "Makara": "CAPRICORN",
-            "Kumbha": "AQUARIUS",
-            "Meena": "PISCES"
-        }
-        
         # Get rasi (zodiac sign) data
-        rasi_data = planet_data.get("rasi", {})
-        rasi_name = rasi_data.get("name", "Mesha")
-        zodiac_name = rasi_map.get(rasi_name, "ARIES")
+        rasi_name = planet_data.get("rasi", {}).get("name", "Mesha")
+        sign = RASI_TO_ZODIAC.get(rasi_name, ZodiacSign.ARIES)
         
         # Map planet name using our mapping
         planet_name = planet_data.get("name", "").upper()
+        planet = PLANET_BY_UPPER.get(planet_name)
         
-        if self.debug:
-            print(f"Converting planet: {planet_data.get('name')} -> {planet_name}")
-            print(f"Converting rasi: {rasi_name} -> {zodiac_name}")
-            print(f"Full planet data: {planet_data}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Converting planet %s -> %s (rasi %s -> %s) data=%s",
+                         planet_data.get('name'), planet_name, rasi_name, sign.name, planet_data)
         
-        try:
-            return PlanetPosition(
-                planet=Planet[planet_name],
-                longitude=float(planet_data.get("longitude", 0)),
-                latitude=0.0,  # Not provided in API
-                distance=0.0,  # Not provided in API
-                speed=0.0,  # Not provided in API
-                sign=ZodiacSign[zodiac_name],
-                degree=float(planet_data.get("degree", 0)),
-                house=int(planet_data.get("position", 1)),
-                retrograde=planet_data.get("is_retrograde", False)
-            )
-        except KeyError as e:
-            if self.debug:
-                print(f"Error converting planet position: {e}")
-                print(f"Available Planet enums: {[p.name for p in Planet]}")
-                print(f"Available ZodiacSign enums: {[z.name for z in ZodiacSign]}")
-            raise ValueError(f"Error mapping planet or zodiac sign: {e}")
+        if planet is None:
+            logger.debug("Unknown planet %s; known: %s", planet_name, [p.name for p in Planet])
+            raise ValueError(f"Error mapping planet or zodiac sign: {planet_name}")
+
+        return PlanetPosition(
+            planet=planet,
+            longitude=float(planet_data.get("longitude", 0)),
+            latitude=0.0,  # Not provided in API
+            distance=0.0,  # Not provided in API
+            speed=0.0,  # Not provided in API
+            sign=sign,
+            degree=float(planet_data.get("degree", 0)),
+            house=int(planet_data.get("position", 1)),
+            retrograde=planet_data.get("is_retrograde", False)
+        )
     
     def _convert_house(self, house_data: Dict[str, Any]) -> House:
         """Convert Prokerala house data to our House model"""
-        return House(
+        # Fields are coerced and enum-mapped here, so skip Pydantic
+        # revalidation with model_construct
+        return House.model_construct(
             number=int(house_data["number"]),
             cusp=float(house_data["cusp"]),
-            sign=ZodiacSign[house_data["sign"].upper()],
-            ruler=Planet[house_data["ruler"].upper()]
+            sign=ZODIAC_BY_UPPER[house_data["sign"].upper()],
+            ruler=PLANET_BY_UPPER[house_data["ruler"].upper()]
         )
     
     def _convert_aspect(self, aspect_data: Dict[str, Any]) -> Aspect:
         """Convert Prokerala aspect data to our Aspect model"""
-        return Aspect(
-            planet1=Planet[aspect_data["planet1"].upper()],
-            planet2=Planet[aspect_data["planet2"].upper()],
+        return Aspect.model_construct(
+            planet1=PLANET_BY_UPPER[aspect_data["planet1"].upper()],
+            planet2=PLANET_BY_UPPER[aspect_data["planet2"].upper()],
             aspect_type=aspect_data["type"],
             angle=float(aspect_data["angle"]),
             orb=float(aspect_data.get("orb", 0)),
@@ -191,13 +244,30 @@ class ProkeralaService:
         """Generate birth chart using Prokerala API"""
         try:
             # Convert datetime to ISO format with timezone
-            birth_datetime = datetime.strptime(
-                f"{request.birth_date} {request.birth_time}", 
-                "%Y-%m-%d %H:%M"
+            birth_datetime = datetime.fromisoformat(
+                f"{request.birth_date}T{request.birth_time}:00"
             )
             
             # Format datetime with timezone
-            formatted_datetime = birth_datetime.strftime("%Y-%m-%dT%H:%M:%S+05:30")
+            formatted_datetime = birth_datetime.replace(tzinfo=IST).isoformat()
+
+            # Chart generation is deterministic in these inputs; serve
+            # repeats from the in-process cache
+            cache_key = (
+                formatted_datetime,
+                round(request.latitude, 4),
+                round(request.longitude, 4),
+                str(request.ayanamsa),
+                str(request.house_system)
+            )
+            entry = self._chart_cache.get(cache_key)
+            if entry is not None:
+                expires_at, cached_response = entry
+                if time.monotonic() < expires_at:
+                    self._chart_cache.move_to_end(cache_key)
+                    # Copy so callers cannot mutate the cached response
+                    return cached_response.model_copy(deep=True)
+                del self._chart_cache[cache_key]
             
             # Prepare API parameters
             params = {
@@ -208,57 +278,72 @@ class ProkeralaService:
                 "la": "en"  # English language
             }
             
-            # Enable debug mode for troubleshooting
-            self.debug = True
-            
             # Make API request
-            response = self._make_request("planet-position", params)
+            response = await self._make_request("planet-position", params)
             
-            if self.debug:
-                print(f"Chart Request Params: {params}")
-                print(f"Response Data: {response}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Chart request params=%s response=%s", params, response)
             
             # Extract data
             chart_data = response.get("data", {})
             planet_data = chart_data.get("planet_position", [])
             
-            # Convert planets
-            planets = [
-                self._convert_planet_position(planet)
-                for planet in planet_data
-            ]
-            
-            # Create chart summary with focus on sun, moon and ascendant signs
-            sun_planet = next((p for p in planets if p.planet == Planet.SUN), None)
-            moon_planet = next((p for p in planets if p.planet == Planet.MOON), None)
-            ascendant_planet = next((p for p in planets if p.planet == Planet.ASCENDANT), None)
-            
-            # Group planets by sign
-            planets_by_sign = {}
-            for planet in planets:
-                sign_name = planet.sign.name
-                if sign_name not in planets_by_sign:
-                    planets_by_sign[sign_name] = []
-                planets_by_sign[sign_name].append(planet.planet.name)
+            # Convert planets on an inlined fast path: lookups and the
+            # constructor are hoisted to locals so the loop avoids repeated
+            # attribute loads, and fields are coerced explicitly so
+            # model_construct can skip revalidation
+            rasi_get = RASI_TO_ZODIAC.get
+            planet_get = PLANET_BY_UPPER.get
+            make_position = PlanetPosition.model_construct
+            aries = ZodiacSign.ARIES
+
+            planets = []
+            for p in planet_data:
+                planet = planet_get(p.get("name", "").upper())
+                if planet is None:
+                    raise ValueError(f"Error mapping planet or zodiac sign: {p.get('name')}")
+                planets.append(make_position(
+                    planet=planet,
+                    longitude=float(p.get("longitude", 0)),
+                    latitude=0.0,  # Not provided in API
+                    distance=0.0,  # Not provided in API
+                    speed=0.0,  # Not provided in API
+                    sign=rasi_get(p.get("rasi", {}).get("name", "Mesha"), aries),
+                    degree=float(p.get("degree", 0)),
+                    house=int(p.get("position", 1)),
+                    retrograde=bool(p.get("is_retrograde", False))
+                ))
             
-            # Group planets by house
-            planets_by_house = {}
+            # Create chart summary in a single pass: sun/moon/ascendant
+            # signs, sign and house groupings, and retrograde planets
+            sun_sign = moon_sign = ascendant_sign = None
+            planets_by_sign = defaultdict(list)
+            planets_by_house = defaultdict(list)
+            retrograde_planets = []
             for planet in planets:
-                house_num = str(planet.house)
-                if house_num not in planets_by_house:
-                    planets_by_house[house_num] = []
-                planets_by_house[house_num].append(planet.planet.name)
+                if planet.planet == Planet.SUN:
+                    sun_sign = planet.sign
+                elif planet.planet == Planet.MOON:
+                    moon_sign = planet.sign
+                elif planet.planet == Planet.ASCENDANT:
+                    ascendant_sign = planet.sign
+                planets_by_sign[planet.sign.name].append(planet.planet.name)
+                planets_by_house[str(planet.house)].append(planet.planet.name)
+                if planet.retrograde:
+                    retrograde_planets.append(planet.planet.name)
             
             chart_summary = {
-                "sun_sign": sun_planet.sign if sun_planet else None,
-                "moon_sign": moon_planet.sign if moon_planet else None,
-                "ascendant_sign": ascendant_planet.sign if ascendant_planet else None,
-                "retrograde_planets": [p.planet.name for p in planets if p.retrograde],
-                "planets_by_sign": planets_by_sign,
-                "planets_by_house": planets_by_house
+                "sun_sign": sun_sign,
+                "moon_sign": moon_sign,
+                "ascendant_sign": ascendant_sign,
+                "retrograde_planets": retrograde_planets,
+                "planets_by_sign": dict(planets_by_sign),
+                "planets_by_house": dict(planets_by_house)
             }
             
-            return BirthChartResponse(
+            # Every field below is already typed by our own conversion
+            # code, so build the response without revalidation
+            chart_response = BirthChartResponse.model_construct(
                 name=request.name,
                 birth_datetime=birth_datetime,
                 location={"latitude": request.latitude, "longitude": request.longitude},
@@ -271,24 +356,36 @@ class ProkeralaService:
                 aspects=[],  # Not provided in planet-position endpoint
                 chart_summary=chart_summary
             )
+
+            self._chart_cache[cache_key] = (time.monotonic() + self._chart_cache_ttl, chart_response)
+            if len(self._chart_cache) > self._chart_cache_max:
+                self._chart_cache.popitem(last=False)
+
+            return chart_response
             
         except Exception as e:
-            if self.debug:
-                import traceback
-                print(f"Error details: {traceback.format_exc()}")
+            logger.debug("Error generating birth chart", exc_info=True)
             raise ValueError(f"Error generating birth chart with Prokerala API: {str(e)}")
 
+    async def generate_many(self, requests: List[BirthChartRequest]) -> List[BirthChartResponse]:
+        """Generate several birth charts concurrently.
+
+        Fires all Prokerala calls at once with asyncio.gather so a burst of
+        N requests overlaps its network waits over the pooled client
+        instead of running one HTTP call at a time.
+        """
+        return await asyncio.gather(*[self.generate_birth_chart(r) for r in requests])
+
     async def get_birth_chart_image(self, request: BirthChartRequest) -> str:
         """Get birth chart image data from Prokerala API"""
         try:
             # Convert datetime to ISO format with timezone
-            birth_datetime = datetime.strptime(
-                f"{request.birth_date} {request.birth_time}", 
-                "%Y-%m-%d %H:%M"
+            birth_datetime = datetime.fromisoformat(
+                f"{request.birth_date}T{request.birth_time}:00"
             )
             
             # Format datetime with timezone
-            formatted_datetime = birth_datetime.strftime("%Y-%m-%dT%H:%M:%S+05:30")
+            formatted_datetime = birth_datetime.replace(tzinfo=IST).isoformat()
             
             # Prepare API parameters
             params = {
@@ -304,33 +401,23 @@ class ProkeralaService:
             
             # Get access token
             headers = {
-                "Authorization": f"Bearer {self._get_access_token()}",
+                "Authorization": f"Bearer {await self._get_access_token()}",
                 "Accept": "image/svg+xml"  # Request SVG format
             }
             
             # Make direct API request since we're expecting SVG, not JSON
             url = f"{self.base_url}/chart"
-            response = requests.get(url, headers=headers, params=params)
+            response = await self.client.get(url, headers=headers, params=params)
             
-            if self.debug:
-                print("\n=== DEBUG: Chart Image Request ===")
-                print(f"URL: {url}")
-                print("Headers:")
-                for key, value in headers.items():
-                    print(f"  {key}: {value}")
-                print("Parameters:")
-                for key, value in params.items():
-                    print(f"  {key}: {value}")
-                print(f"Response Status: {response.status_code}")
-                print("=== END Chart Image Request ===\n")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Chart image request url=%s headers=%s params=%s status=%s",
+                             url, headers, params, response.status_code)
             
             response.raise_for_status()
             return response.text  # Return SVG content
             
         except Exception as e:
-            if self.debug:
-                import traceback
-                print(f"Error details: {traceback.format_exc()}")
+            logger.debug("Error getting birth chart image", exc_info=True)
             raise ValueError(f"Error getting birth chart image: {str(e)}")
 
 # Create service instance
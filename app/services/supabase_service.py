@@ -4,9 +4,12 @@ Supabase Database Service
 Handles all database operations for user profiles and authentication
 """
 
+import asyncio
 import os
 import base64
 import logging
+import time
+from collections import OrderedDict
 from typing import Dict, Optional, Any, List
 from datetime import datetime, timedelta
 from supabase import create_client, Client
@@ -35,6 +38,12 @@ class SupabaseService:
             # Initialize Supabase client with minimal configuration
             self.supabase = create_client(self.supabase_url, self.supabase_key)
             logger.info("Supabase client initialized successfully")
+
+            # In-memory tier in front of the birth_chart_cache table: hot
+            # users skip the Supabase round trip entirely
+            self._mem_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+            self._mem_cache_max = 2048
+            self._mem_cache_ttl = 600.0
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {str(e)}")
             raise
@@ -43,12 +52,21 @@ class SupabaseService:
         """Get the initialized Supabase client"""
         return self.supabase
 
+    @staticmethod
+    async def _execute(query):
+        """Run a blocking PostgREST query in a worker thread.
+
+        supabase-py 2.0.x only ships a synchronous client; executing it
+        inline would block the event loop for the whole round trip.
+        """
+        return await asyncio.to_thread(query.execute)
+
     async def create_profile(self, profile_data: ProfileCreateRequest) -> Optional[UserProfile]:
         """Create a new user profile"""
         try:
             data = profile_data.model_dump()
             logger.info(f"Creating profile with data: {data}")
-            response = self.supabase.table('user_profiles').insert(data).execute()
+            response = await self._execute(self.supabase.table('user_profiles').insert(data))
             logger.info(f"Supabase response: {response.data}")
             
             if response.data:
@@ -61,8 +79,11 @@ class SupabaseService:
     async def get_profile(self, user_id: str) -> Optional[UserProfile]:
         """Get a user profile by user_id"""
         try:
-            response = self.supabase.table('user_profiles').select('*')\
-                .match({'user_id': user_id}).execute()
+            # Project the columns the model needs instead of SELECT *
+            response = await self._execute(self.supabase.table('user_profiles')
+                .select('id,user_id,name,birth_date,birth_time,latitude,longitude,'
+                        'timezone,city,state,country,created_at,updated_at')
+                .match({'user_id': user_id}))
             
             if response.data:
                 return UserProfile(**response.data[0])
@@ -75,8 +96,8 @@ class SupabaseService:
         """Update a user profile"""
         try:
             data = profile_data.model_dump(exclude_unset=True)
-            response = self.supabase.table('user_profiles').update(data)\
-                .match({'user_id': user_id}).execute()
+            response = await self._execute(self.supabase.table('user_profiles').update(data)
+                .match({'user_id': user_id}))
             
             if response.data:
                 return UserProfile(**response.data[0])
@@ -88,8 +109,8 @@ class SupabaseService:
     async def delete_profile(self, user_id: str) -> bool:
         """Delete a user profile"""
         try:
-            response = self.supabase.table('user_profiles').delete()\
-                .match({'user_id': user_id}).execute()
+            response = await self._execute(self.supabase.table('user_profiles').delete()
+                .match({'user_id': user_id}))
             return bool(response.data)
         except APIError as e:
             logger.error(f"Failed to delete profile: {str(e)}")
@@ -98,8 +119,8 @@ class SupabaseService:
     async def profile_exists(self, user_id: str) -> bool:
         """Check if a profile exists"""
         try:
-            response = self.supabase.table('user_profiles').select('id')\
-                .match({'user_id': user_id}).execute()
+            response = await self._execute(self.supabase.table('user_profiles').select('id')
+                .match({'user_id': user_id}))
             return bool(response.data)
         except APIError as e:
             logger.error(f"Failed to check profile existence: {str(e)}")
@@ -108,11 +129,14 @@ class SupabaseService:
     async def health_check(self) -> Dict[str, Any]:
         """Check database connection health"""
         try:
-            # Simple query to check database connection
-            response = self.supabase.table('user_profiles').select('count').execute()
+            # Column-less select with a count: postgrest issues a HEAD-style
+            # count request, so Postgres counts the rows and no row payload
+            # crosses the wire
+            response = await self._execute(
+                self.supabase.table('user_profiles').select(count='exact'))
             return {
                 "status": "connected",
-                "total_profiles": len(response.data) if response.data else 0
+                "total_profiles": response.count or 0
             }
         except Exception as e:
             logger.error(f"Database health check failed: {str(e)}")
@@ -124,15 +148,20 @@ class SupabaseService:
     async def get_birth_chart_details(self, user_id: str) -> Optional[BirthChartDetails]:
         """Get birth chart details for a user"""
         try:
-            response = self.supabase.table('birth_chart_details').select('*')\
-                .match({'user_id': user_id}).execute()
+            response = await self._execute(self.supabase.table('birth_chart_details')
+                .select('id,user_id,planet_positions,chart_image,created_at,updated_at')
+                .match({'user_id': user_id}))
             
             if response.data:
                 data = response.data[0]
                 
-                # Handle chart_image decoding with error handling
+                # chart_image is a bytea column; PostgREST returns it in
+                # Postgres hex format (\x...). Legacy rows written through
+                # the old base64 layer are still decoded as a fallback.
                 chart_image_data = data.get('chart_image', '')
-                if chart_image_data:
+                if isinstance(chart_image_data, str) and chart_image_data.startswith('\\x'):
+                    data['chart_image'] = bytes.fromhex(chart_image_data[2:])
+                elif chart_image_data:
                     try:
                         data['chart_image'] = base64.b64decode(chart_image_data)
                     except Exception as decode_error:
@@ -157,12 +186,14 @@ class SupabaseService:
                 'updated_at': datetime.now().isoformat()
             }
             
-            # Only include chart_image if it's provided and not empty
+            # Only include chart_image if it's provided and not empty.
+            # Written in Postgres hex format so the bytea column stores the
+            # raw bytes instead of a base64 string of them.
             if chart_image:
-                data['chart_image'] = base64.b64encode(chart_image).decode('utf-8')
+                data['chart_image'] = '\\x' + chart_image.hex()
             
             # Try to update existing record first
-            response = self.supabase.table('birth_chart_details').upsert(data).execute()
+            response = await self._execute(self.supabase.table('birth_chart_details').upsert(data))
             
             return bool(response.data)
         except APIError as e:
@@ -172,8 +203,8 @@ class SupabaseService:
     async def delete_birth_chart_details(self, user_id: str) -> bool:
         """Delete birth chart details for a user"""
         try:
-            response = self.supabase.table('birth_chart_details').delete()\
-                .match({'user_id': user_id}).execute()
+            response = await self._execute(self.supabase.table('birth_chart_details').delete()
+                .match({'user_id': user_id}))
             return bool(response.data)
         except APIError as e:
             logger.error(f"Failed to delete birth chart details: {str(e)}")
@@ -183,27 +214,37 @@ class SupabaseService:
                                    latitude: float, longitude: float, timezone: str,
                                    house_system: str = "Placidus", ayanamsa: str = "Lahiri") -> Optional[Dict[str, Any]]:
         """Get cached birth chart if it exists"""
+        mem_key = (user_id, birth_date, birth_time, latitude, longitude,
+                   timezone, house_system, ayanamsa)
+        entry = self._mem_cache.get(mem_key)
+        if entry is not None:
+            expires_at, chart_data = entry
+            if time.monotonic() < expires_at:
+                self._mem_cache.move_to_end(mem_key)
+                return chart_data
+            del self._mem_cache[mem_key]
+
         try:
-            response = self.supabase.table('birth_chart_cache').select('*')\
-                .match({
-                    'user_id': user_id,
-                    'birth_date': birth_date,
-                    'birth_time': birth_time,
-                    'latitude': latitude,
-                    'longitude': longitude,
-                    'timezone': timezone,
-                    'house_system': house_system,
-                    'ayanamsa': ayanamsa
-                }).execute()
-            
+            # One atomic RPC selects the chart and touches last_accessed_at
+            # server-side, instead of a SELECT plus a follow-up UPDATE
+            response = await self._execute(self.supabase.rpc('get_and_touch_chart_cache', {
+                'p_user_id': user_id,
+                'p_birth_date': birth_date,
+                'p_birth_time': birth_time,
+                'p_latitude': latitude,
+                'p_longitude': longitude,
+                'p_timezone': timezone,
+                'p_house_system': house_system,
+                'p_ayanamsa': ayanamsa
+            }))
+
             if response.data:
-                # Update last accessed timestamp
-                cache_id = response.data[0]['id']
-                self.supabase.table('birth_chart_cache').update({
-                    'last_accessed_at': datetime.now().isoformat()
-                }).match({'id': cache_id}).execute()
-                
-                return response.data[0]['chart_data']
+                chart_data = response.data
+                self._mem_cache[mem_key] = (time.monotonic() + self._mem_cache_ttl, chart_data)
+                if len(self._mem_cache) > self._mem_cache_max:
+                    self._mem_cache.popitem(last=False)
+
+                return chart_data
             return None
         except APIError as e:
             logger.error(f"Failed to get cached birth chart: {str(e)}")
@@ -229,18 +270,45 @@ class SupabaseService:
                 'last_accessed_at': datetime.now().isoformat()
             }
             
-            response = self.supabase.table('birth_chart_cache').upsert(data).execute()
+            response = await self._execute(self.supabase.table('birth_chart_cache').upsert(data))
             return bool(response.data)
         except APIError as e:
             logger.error(f"Failed to cache birth chart: {str(e)}")
             return False
 
+    async def save_chart_and_cache(self, user_id: str, planet_positions: List[Dict[str, Any]],
+                                   chart_data: Dict[str, Any], birth_date: str, birth_time: str,
+                                   latitude: float, longitude: float, timezone: str,
+                                   house_system: str = "Placidus", ayanamsa: str = "Lahiri") -> bool:
+        """Save birth chart details and cache the chart in one round trip.
+
+        Wraps the save_chart_and_cache SQL function, which writes both
+        tables in a single transaction instead of two upsert calls.
+        """
+        try:
+            await self._execute(self.supabase.rpc('save_chart_and_cache', {
+                'p_user_id': user_id,
+                'p_planet_positions': planet_positions,
+                'p_chart_data': chart_data,
+                'p_birth_date': birth_date,
+                'p_birth_time': birth_time,
+                'p_latitude': latitude,
+                'p_longitude': longitude,
+                'p_timezone': timezone,
+                'p_house_system': house_system,
+                'p_ayanamsa': ayanamsa
+            }))
+            return True
+        except APIError as e:
+            logger.error(f"Failed to save chart and cache: {str(e)}")
+            return False
+
     async def clear_old_cache_entries(self, days_old: int = 30) -> bool:
         """Clear cache entries older than specified days"""
         try:
             cutoff_date = (datetime.now() - timedelta(days=days_old)).isoformat()
-            response = self.supabase.table('birth_chart_cache')\
-                .delete().lt('last_accessed_at', cutoff_date).execute()
+            response = await self._execute(self.supabase.table('birth_chart_cache')
+                .delete().lt('last_accessed_at', cutoff_date))
             return bool(response.data)
         except APIError as e:
             logger.error(f"Failed to clear old cache entries: {str(e)}")
@@ -8,194 +8,272 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-import json
+import asyncio
+import numpy as np
+import orjson
 from datetime import datetime
-from app.models import BirthChartRequest, HouseSystem
+from itertools import islice
+from typing import Dict
+from app.models import BirthChartRequest, BirthChartResponse, HouseSystem
 from app.services.birth_chart import birth_chart_service
 
+# Charts for the same birth data are reused across demos instead of
+# recomputed; only the house system differs between some requests
+_chart_cache: Dict[tuple, BirthChartResponse] = {}
+
+def generate_chart_cached(request: BirthChartRequest) -> BirthChartResponse:
+    """Generate a birth chart, reusing a previous result for identical inputs."""
+    key = (request.birth_date, request.birth_time, request.latitude,
+           request.longitude, request.timezone, request.house_system)
+    chart = _chart_cache.get(key)
+    if chart is None:
+        chart = asyncio.run(birth_chart_service.generate_birth_chart(request))
+        _chart_cache[key] = chart
+    return chart
+
+# Hoisted filter sets: built once instead of per loop iteration
+KEY_PLANETS = ('Sun', 'Moon', 'Mercury', 'Venus', 'Mars')
+MAJOR_ASPECTS = ('Conjunction', 'Opposition', 'Trine', 'Square', 'Sextile')
+
+_PLANET_DTYPE = np.dtype([('name', 'U10'), ('degree', 'f8'), ('sign', 'U15'),
+                          ('house', 'u1'), ('retro', '?')])
+_ASPECT_DTYPE = np.dtype([('planet1', 'U10'), ('planet2', 'U10'),
+                          ('aspect_type', 'U12'), ('orb', 'f8')])
+
+def _planets_soa(chart) -> np.ndarray:
+    """Planet list as a structured array so filters become boolean masks."""
+    return np.array([(p.planet.value, p.degree, p.sign.value, p.house, p.retrograde)
+                     for p in chart.planets], dtype=_PLANET_DTYPE)
+
+def _aspects_soa(chart) -> np.ndarray:
+    """Aspect list as a structured array for vectorized type filtering."""
+    return np.array([(a.planet1.value, a.planet2.value, a.aspect_type, a.orb)
+                     for a in chart.aspects], dtype=_ASPECT_DTYPE)
+
+def _stream_chart_json(chart, limit: int = 3):
+    """Yield the sample JSON response as encoded chunks.
+
+    Planets, houses and aspects are encoded one element at a time so the
+    full serialized response is never materialized in memory; islice
+    stops each iteration at `limit` without building sliced copies.
+    """
+    yield orjson.dumps({
+        "name": chart.name,
+        "birth_datetime": chart.birth_datetime.isoformat(),
+        "location": chart.location,
+        "julian_day": chart.julian_day,
+        "house_system": chart.house_system.value,
+    })[:-1]  # drop the closing brace; the arrays below continue the object
+    yield b',"planets":['
+    for i, p in enumerate(islice(chart.planets, limit)):
+        if i:
+            yield b","
+        yield orjson.dumps({
+            "planet": p.planet.value,
+            # rounded once so orjson emits compact floats
+            "longitude": round(p.longitude, 4),
+            "latitude": round(p.latitude, 4),
+            "sign": p.sign.value,
+            "degree": p.degree,
+            "house": p.house,
+            "retrograde": p.retrograde,
+        })
+    yield b'],"houses":['
+    for i, h in enumerate(islice(chart.houses, limit)):
+        if i:
+            yield b","
+        yield orjson.dumps({
+            "number": h.number,
+            "cusp": h.cusp,
+            "sign": h.sign.value,
+            "ruler": h.ruler.value,
+        })
+    yield b'],"aspects":['
+    for i, a in enumerate(islice(chart.aspects, limit)):
+        if i:
+            yield b","
+        yield orjson.dumps({
+            "planet1": a.planet1.value,
+            "planet2": a.planet2.value,
+            "aspect_type": a.aspect_type,
+            "angle": a.angle,
+            "orb": a.orb,
+            "applying": a.applying,
+        })
+    yield b'],"chart_summary":'
+    yield orjson.dumps(chart.chart_summary)
+    yield b"}\n"
+
+# Demo requests are fixed literals; build them once at import so pydantic
+# validation runs a single time per request instead of per demo run
+EINSTEIN_REQUEST = BirthChartRequest(
+    name="Albert Einstein",
+    birth_date="1879-03-14",
+    birth_time="11:30",
+    latitude=48.3969,  # Ulm, Germany
+    longitude=9.9918,
+    timezone="Europe/Berlin",
+    house_system=HouseSystem.PLACIDUS
+)
+
+MODERN_REQUEST = BirthChartRequest(
+    name="Demo Person",
+    birth_date="1990-07-15",
+    birth_time="15:30",
+    latitude=34.0522,  # Los Angeles
+    longitude=-118.2437,
+    timezone="America/Los_Angeles",
+    house_system=HouseSystem.KOCH
+)
+
+SAMPLE_REQUEST = BirthChartRequest(
+    name="API Sample",
+    birth_date="2000-01-01",
+    birth_time="12:00",
+    latitude=40.7128,
+    longitude=-74.0060,
+    house_system=HouseSystem.PLACIDUS
+)
+
+BASE_REQUEST = BirthChartRequest(
+    name="House System Demo",
+    birth_date="1985-06-21",
+    birth_time="10:00",
+    latitude=51.5074,  # London
+    longitude=-0.1278,
+    timezone="Europe/London"
+)
+
 def demo_birth_chart_api():
-    """Demonstrate the complete birth chart API functionality."""
-    print("🌟 Starlight Astrology API Demo")
-    print("=" * 60)
-    
+    """Demonstrate the complete birth chart API functionality.
+
+    Output lines are accumulated per demo section and emitted with a
+    single print, so each section costs one stdout write instead of
+    dozens of small, individually flushed ones.
+    """
     # Demo 1: Famous Person - Albert Einstein
-    print("\n🎯 Demo 1: Albert Einstein's Birth Chart")
-    print("-" * 40)
-    
-    einstein_request = BirthChartRequest(
-        name="Albert Einstein",
-        birth_date="1879-03-14",
-        birth_time="11:30",
-        latitude=48.3969,  # Ulm, Germany
-        longitude=9.9918,
-        timezone="Europe/Berlin",
-        house_system=HouseSystem.PLACIDUS
-    )
-    
+    out = ["🌟 Starlight Astrology API Demo",
+           "=" * 60,
+           "\n🎯 Demo 1: Albert Einstein's Birth Chart",
+           "-" * 40]
+
     try:
-        chart = birth_chart_service.generate_birth_chart(einstein_request)
-        print(f"✅ Successfully generated chart for {chart.name}")
-        print(f"📅 Birth: {chart.birth_datetime}")
-        print(f"🏠 House System: {chart.house_system}")
-        print(f"🌟 Sun Sign: {chart.chart_summary['sun_sign']}")
-        print(f"🌙 Moon Sign: {chart.chart_summary['moon_sign']}")
-        print(f"⬆️ Ascendant: {chart.chart_summary['ascendant_sign']}")
-        print(f"🔮 Dominant Sign: {chart.chart_summary['dominant_sign']}")
-        print(f"🔄 Retrograde Planets: {chart.chart_summary['retrograde_planets']}")
-        
-        # Show some key planets
-        print("\n🪐 Key Planet Positions:")
-        for planet in chart.planets:
-            if planet.planet.value in ['Sun', 'Moon', 'Mercury', 'Venus', 'Mars']:
-                retrograde_symbol = " [R]" if planet.retrograde else ""
-                print(f"  {planet.planet.value:>7}: {planet.degree:.1f}° {planet.sign.value} in House {planet.house}{retrograde_symbol}")
-        
+        chart = generate_chart_cached(EINSTEIN_REQUEST)
+        out.append(f"✅ Successfully generated chart for {chart.name}")
+        out.append(f"📅 Birth: {chart.birth_datetime}")
+        out.append(f"🏠 House System: {chart.house_system}")
+        out.append(f"🌟 Sun Sign: {chart.chart_summary['sun_sign']}")
+        out.append(f"🌙 Moon Sign: {chart.chart_summary['moon_sign']}")
+        out.append(f"⬆️ Ascendant: {chart.chart_summary['ascendant_sign']}")
+        out.append(f"🔮 Dominant Sign: {chart.chart_summary['dominant_sign']}")
+        out.append(f"🔄 Retrograde Planets: {chart.chart_summary['retrograde_planets']}")
+
+        # Show some key planets: one vectorized mask instead of a
+        # per-planet attribute-access filter
+        out.append("\n🪐 Key Planet Positions:")
+        planets_arr = _planets_soa(chart)
+        key = planets_arr[np.isin(planets_arr['name'], KEY_PLANETS)]
+        # Format the whole degree column in one C call instead of per-row
+        # __format__ dispatch
+        degree_strs = np.char.mod('%.1f', key['degree'])
+        for row, degree_str in zip(key, degree_strs):
+            retrograde_symbol = " [R]" if row['retro'] else ""
+            out.append(f"  {row['name']:>7}: {degree_str}° {row['sign']} in House {row['house']}{retrograde_symbol}")
+
         # Show some aspects
-        print("\n🔄 Major Aspects:")
-        major_aspects = [a for a in chart.aspects if a.aspect_type in ['Conjunction', 'Opposition', 'Trine', 'Square', 'Sextile']]
+        out.append("\n🔄 Major Aspects:")
+        aspects_arr = _aspects_soa(chart)
+        major_aspects = aspects_arr[np.isin(aspects_arr['aspect_type'], MAJOR_ASPECTS)]
         for aspect in major_aspects[:5]:
-            print(f"  {aspect.planet1.value} {aspect.aspect_type} {aspect.planet2.value} (orb: {aspect.orb:.1f}°)")
-        
+            out.append(f"  {aspect['planet1']} {aspect['aspect_type']} {aspect['planet2']} (orb: {aspect['orb']:.1f}°)")
+
+        print("\n".join(out))
     except Exception as e:
+        print("\n".join(out))
         print(f"❌ Error: {str(e)}")
         return False
-    
+
     # Demo 2: Modern Person with Different House System
-    print("\n\n🎯 Demo 2: Modern Birth Chart (Koch House System)")
-    print("-" * 50)
-    
-    modern_request = BirthChartRequest(
-        name="Demo Person",
-        birth_date="1990-07-15",
-        birth_time="15:30",
-        latitude=34.0522,  # Los Angeles
-        longitude=-118.2437,
-        timezone="America/Los_Angeles",
-        house_system=HouseSystem.KOCH
-    )
-    
+    out = ["\n\n🎯 Demo 2: Modern Birth Chart (Koch House System)",
+           "-" * 50]
+
     try:
-        chart2 = birth_chart_service.generate_birth_chart(modern_request)
-        print(f"✅ Successfully generated chart for {chart2.name}")
-        print(f"🏠 House System: {chart2.house_system}")
-        print(f"🌟 Sun Sign: {chart2.chart_summary['sun_sign']}")
-        print(f"🌙 Moon Sign: {chart2.chart_summary['moon_sign']}")
-        print(f"⬆️ Ascendant: {chart2.chart_summary['ascendant_sign']}")
-        
+        chart2 = generate_chart_cached(MODERN_REQUEST)
+        out.append(f"✅ Successfully generated chart for {chart2.name}")
+        out.append(f"🏠 House System: {chart2.house_system}")
+        out.append(f"🌟 Sun Sign: {chart2.chart_summary['sun_sign']}")
+        out.append(f"🌙 Moon Sign: {chart2.chart_summary['moon_sign']}")
+        out.append(f"⬆️ Ascendant: {chart2.chart_summary['ascendant_sign']}")
+
         # Show house cusps
-        print("\n🏠 House Cusps:")
+        out.append("\n🏠 House Cusps:")
         for house in chart2.houses[:6]:  # Show first 6 houses
-            print(f"  House {house.number}: {house.cusp:.1f}° {house.sign.value} (ruled by {house.ruler.value})")
-        
+            out.append(f"  House {house.number}: {house.cusp:.1f}° {house.sign.value} (ruled by {house.ruler.value})")
+
+        print("\n".join(out))
     except Exception as e:
+        print("\n".join(out))
         print(f"❌ Error: {str(e)}")
         return False
-    
+
     # Demo 3: API Response Format
-    print("\n\n🎯 Demo 3: JSON API Response Format")
-    print("-" * 40)
-    
-    # Create a sample response for JSON serialization
-    sample_request = BirthChartRequest(
-        name="API Sample",
-        birth_date="2000-01-01",
-        birth_time="12:00",
-        latitude=40.7128,
-        longitude=-74.0060,
-        house_system=HouseSystem.PLACIDUS
-    )
-    
+    print("\n\n🎯 Demo 3: JSON API Response Format\n" + "-" * 40)
+
     try:
-        chart3 = birth_chart_service.generate_birth_chart(sample_request)
-        
-        # Convert to dict for JSON serialization
-        response_data = {
-            "name": chart3.name,
-            "birth_datetime": chart3.birth_datetime.isoformat(),
-            "location": chart3.location,
-            "julian_day": chart3.julian_day,
-            "house_system": chart3.house_system.value,
-            "planets": [
-                {
-                    "planet": p.planet.value,
-                    "longitude": p.longitude,
-                    "latitude": p.latitude,
-                    "sign": p.sign.value,
-                    "degree": p.degree,
-                    "house": p.house,
-                    "retrograde": p.retrograde
-                } for p in chart3.planets[:3]  # Show first 3 planets
-            ],
-            "houses": [
-                {
-                    "number": h.number,
-                    "cusp": h.cusp,
-                    "sign": h.sign.value,
-                    "ruler": h.ruler.value
-                } for h in chart3.houses[:3]  # Show first 3 houses
-            ],
-            "aspects": [
-                {
-                    "planet1": a.planet1.value,
-                    "planet2": a.planet2.value,
-                    "aspect_type": a.aspect_type,
-                    "angle": a.angle,
-                    "orb": a.orb,
-                    "applying": a.applying
-                } for a in chart3.aspects[:3]  # Show first 3 aspects
-            ],
-            "chart_summary": chart3.chart_summary
-        }
-        
+        chart3 = generate_chart_cached(SAMPLE_REQUEST)
+
+        # Stream the response chunk by chunk instead of building the full
+        # dict and serialized string in memory first
         print("✅ Sample JSON Response (first 3 planets/houses/aspects):")
-        print(json.dumps(response_data, indent=2))
-        
+        buf = sys.stdout.buffer
+        for chunk in _stream_chart_json(chart3):
+            buf.write(chunk)
+        buf.flush()
+
     except Exception as e:
         print(f"❌ Error: {str(e)}")
         return False
-    
+
     # Demo 4: Different House Systems Comparison
-    print("\n\n🎯 Demo 4: House System Comparison")
-    print("-" * 40)
-    
-    base_request = BirthChartRequest(
-        name="House System Demo",
-        birth_date="1985-06-21",
-        birth_time="10:00",
-        latitude=51.5074,  # London
-        longitude=-0.1278,
-        timezone="Europe/London"
-    )
-    
+    out = ["\n\n🎯 Demo 4: House System Comparison",
+           "-" * 40]
+
     house_systems = [HouseSystem.PLACIDUS, HouseSystem.KOCH, HouseSystem.EQUAL]
-    
-    for system in house_systems:
-        try:
-            base_request.house_system = system
-            chart = birth_chart_service.generate_birth_chart(base_request)
-            
-            print(f"\n{system.value} House System:")
-            print(f"  Ascendant: {chart.chart_summary['ascendant_sign']}")
-            print(f"  1st House: {chart.houses[0].cusp:.1f}° {chart.houses[0].sign.value}")
-            print(f"  10th House: {chart.houses[9].cusp:.1f}° {chart.houses[9].sign.value}")
-            
-        except Exception as e:
-            print(f"❌ Error with {system.value}: {str(e)}")
-    
-    print("\n" + "=" * 60)
-    print("🎉 API Demo Complete!")
-    print("\nThe Starlight Astrology API provides:")
-    print("✨ Comprehensive birth chart generation")
-    print("🪐 Accurate planetary positions using Swiss Ephemeris")
-    print("🏠 Multiple house systems (Placidus, Koch, Equal, Whole Sign)")
-    print("🔄 Planetary aspects with orbs")
-    print("📊 Chart summaries and interpretations")
-    print("🌍 Timezone and location handling")
-    print("📱 JSON API responses ready for web/mobile apps")
-    
-    print("\n🚀 Ready to integrate with your frontend!")
-    print("API Documentation: http://localhost:8000/docs")
-    
+
+    # The three per-system charts are independent; generate them
+    # concurrently and print in order once all have arrived
+    # model_copy skips re-validating the unchanged fields
+    requests = [BASE_REQUEST.model_copy(update={"house_system": system})
+                for system in house_systems]
+
+    async def _gather_charts():
+        return await asyncio.gather(
+            *(birth_chart_service.generate_birth_chart(r) for r in requests),
+            return_exceptions=True)
+
+    for system, chart in zip(house_systems, asyncio.run(_gather_charts())):
+        if isinstance(chart, Exception):
+            out.append(f"❌ Error with {system.value}: {str(chart)}")
+            continue
+        out.append(f"\n{system.value} House System:")
+        out.append(f"  Ascendant: {chart.chart_summary['ascendant_sign']}")
+        out.append(f"  1st House: {chart.houses[0].cusp:.1f}° {chart.houses[0].sign.value}")
+        out.append(f"  10th House: {chart.houses[9].cusp:.1f}° {chart.houses[9].sign.value}")
+
+    out.append("\n" + "=" * 60)
+    out.append("🎉 API Demo Complete!")
+    out.append("\nThe Starlight Astrology API provides:")
+    out.append("✨ Comprehensive birth chart generation")
+    out.append("🪐 Accurate planetary positions using Swiss Ephemeris")
+    out.append("🏠 Multiple house systems (Placidus, Koch, Equal, Whole Sign)")
+    out.append("🔄 Planetary aspects with orbs")
+    out.append("📊 Chart summaries and interpretations")
+    out.append("🌍 Timezone and location handling")
+    out.append("📱 JSON API responses ready for web/mobile apps")
+    out.append("\n🚀 Ready to integrate with your frontend!")
+    out.append("API Documentation: http://localhost:8000/docs")
+    print("\n".join(out))
+
     return True
 
 if __name__ == "__main__":
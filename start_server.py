@@ -4,31 +4,54 @@ Simple script to start the Starlight Astrology API server
 and display information about accessing the Swagger documentation.
 """
 
+import os
+import sys
 import uvicorn
+import urllib.request
 import webbrowser
 import time
 import threading
 from pathlib import Path
 
 def open_browser():
-    """Open browser to the Swagger documentation after a short delay."""
-    time.sleep(3)  # Wait for server to start
+    """Open browser to the Swagger documentation once the server is up.
+
+    Polls /openapi.json instead of sleeping a fixed 3 seconds: warm
+    starts open the docs as soon as uvicorn answers, and cold starts no
+    longer race the server and show connection-refused.
+    """
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen("http://127.0.0.1:8000/openapi.json", timeout=0.2)
+            break
+        except OSError:
+            time.sleep(0.1)
     print("\n🌟 Opening Swagger Documentation in your browser...")
     webbrowser.open("http://localhost:8000/docs")
 
 def main():
+    # Auto-reload forks a file-watcher supervisor and re-imports the app
+    # on every save; keep it opt-in so production runs get worker
+    # processes instead
+    reload_flag = os.environ.get("STARLIGHT_RELOAD") == "1"
+    workers = None if reload_flag else min(4, os.cpu_count() or 1)
+    
     print("🌟 Starlight Astrology API Server")
     print("=" * 50)
     print("🚀 Starting server on http://localhost:8000")
+    print(f"⚙️  Mode: {'auto-reload' if reload_flag else f'{workers} worker(s)'}")
     print("📚 Swagger UI will be available at: http://localhost:8000/docs")
     print("📖 ReDoc documentation: http://localhost:8000/redoc")
     print("🔧 OpenAPI JSON schema: http://localhost:8000/openapi.json")
     print("=" * 50)
     
-    # Open browser in a separate thread
-    browser_thread = threading.Thread(target=open_browser)
-    browser_thread.daemon = True
-    browser_thread.start()
+    # Open browser in a separate thread; skip it for non-interactive
+    # runs (CI, service managers) where a browser makes no sense
+    if sys.stdout.isatty():
+        browser_thread = threading.Thread(target=open_browser)
+        browser_thread.daemon = True
+        browser_thread.start()
     
     # Start the server
     try:
@@ -36,7 +59,8 @@ def main():
             "app.main:app",
             host="127.0.0.1",
             port=8000,
-            reload=True,
+            reload=reload_flag,
+            workers=workers,
             log_level="info"
         )
     except KeyboardInterrupt:
@@ -133,7 +133,8 @@ CREATE TABLE IF NOT EXISTS birth_chart_details (
     planet_positions JSONB NOT NULL,
     chart_image BYTEA NOT NULL,
     created_at TIMESTAMP(3) WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP(3) WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP(3) WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id)
 );
 
 -- Create index for better performance
@@ -167,4 +168,71 @@ GRANT SELECT, INSERT, UPDATE, DELETE ON birth_chart_details TO authenticated;
 -- Add comments for documentation
 COMMENT ON TABLE birth_chart_details IS 'Stores user birth chart details including planet positions and chart image';
 COMMENT ON COLUMN birth_chart_details.planet_positions IS 'JSON array of planet positions with signs and degrees';
-COMMENT ON COLUMN birth_chart_details.chart_image IS 'Binary data of the birth chart image';
\ No newline at end of file
+COMMENT ON COLUMN birth_chart_details.chart_image IS 'Binary data of the birth chart image';
+-- Atomic read-and-touch for the birth chart cache: returns the cached
+-- chart_data while updating last_accessed_at in the same statement, so the
+-- client needs one RPC instead of a SELECT followed by an UPDATE.
+CREATE OR REPLACE FUNCTION get_and_touch_chart_cache(
+    p_user_id UUID,
+    p_birth_date TEXT,
+    p_birth_time TEXT,
+    p_latitude DOUBLE PRECISION,
+    p_longitude DOUBLE PRECISION,
+    p_timezone TEXT,
+    p_house_system TEXT,
+    p_ayanamsa TEXT
+)
+RETURNS JSONB AS $$
+    UPDATE birth_chart_cache
+    SET last_accessed_at = NOW()
+    WHERE user_id = p_user_id
+      AND birth_date = p_birth_date
+      AND birth_time = p_birth_time
+      AND latitude = p_latitude
+      AND longitude = p_longitude
+      AND timezone = p_timezone
+      AND house_system = p_house_system
+      AND ayanamsa = p_ayanamsa
+    RETURNING chart_data;
+$$ LANGUAGE sql;
+
+GRANT EXECUTE ON FUNCTION get_and_touch_chart_cache TO authenticated;
+
+-- Write birth chart details and the chart cache row in one transaction so
+-- the client issues a single RPC instead of two upsert round trips.
+CREATE OR REPLACE FUNCTION save_chart_and_cache(
+    p_user_id UUID,
+    p_planet_positions JSONB,
+    p_chart_data JSONB,
+    p_birth_date TEXT,
+    p_birth_time TEXT,
+    p_latitude DOUBLE PRECISION,
+    p_longitude DOUBLE PRECISION,
+    p_timezone TEXT,
+    p_house_system TEXT,
+    p_ayanamsa TEXT
+)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO birth_chart_details (user_id, planet_positions, chart_image, updated_at)
+    VALUES (p_user_id, p_planet_positions, ''::BYTEA, NOW())
+    ON CONFLICT (user_id) DO UPDATE
+        SET planet_positions = EXCLUDED.planet_positions,
+            updated_at = NOW();
+
+    INSERT INTO birth_chart_cache (
+        user_id, birth_date, birth_time, latitude, longitude, timezone,
+        house_system, ayanamsa, chart_data, created_at, last_accessed_at
+    )
+    VALUES (
+        p_user_id, p_birth_date, p_birth_time, p_latitude, p_longitude,
+        p_timezone, p_house_system, p_ayanamsa, p_chart_data, NOW(), NOW()
+    )
+    ON CONFLICT (user_id, birth_date, birth_time, latitude, longitude,
+                 timezone, house_system, ayanamsa) DO UPDATE
+        SET chart_data = EXCLUDED.chart_data,
+            last_accessed_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+GRANT EXECUTE ON FUNCTION save_chart_and_cache TO authenticated;
@@ -8,14 +8,24 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import asyncio
+import io
 from datetime import datetime
+import numpy as np
 from app.models import BirthChartRequest, HouseSystem
 from app.services.birth_chart import birth_chart_service
 
+# With --verbose every line hits stdout immediately; otherwise output is
+# accumulated and flushed once, amortizing the stdout lock and write
+# syscalls across the ~40 lines this test emits
+VERBOSE = "--verbose" in sys.argv
+
 def test_birth_chart_generation():
     """Test birth chart generation with sample data."""
-    print("🌟 Testing Starlight Astrology API...")
-    print("=" * 50)
+    buf = sys.stdout if VERBOSE else io.StringIO()
+    w = buf.write
+    w("🌟 Testing Starlight Astrology API...\n")
+    w("=" * 50 + "\n")
     
     # Test data - Using a famous birth chart (Albert Einstein)
     test_request = BirthChartRequest(
@@ -29,60 +39,66 @@ def test_birth_chart_generation():
     )
     
     try:
-        print(f"📅 Generating birth chart for: {test_request.name}")
-        print(f"📍 Date: {test_request.birth_date} at {test_request.birth_time}")
-        print(f"🌍 Location: {test_request.latitude}, {test_request.longitude}")
-        print(f"🏠 House System: {test_request.house_system}")
-        print()
+        w(f"📅 Generating birth chart for: {test_request.name}\n")
+        w(f"📍 Date: {test_request.birth_date} at {test_request.birth_time}\n")
+        w(f"🌍 Location: {test_request.latitude}, {test_request.longitude}\n")
+        w(f"🏠 House System: {test_request.house_system}\n\n")
         
         # Generate the birth chart
-        chart = birth_chart_service.generate_birth_chart(test_request)
+        chart = asyncio.run(birth_chart_service.generate_birth_chart(test_request))
         
-        print("✅ Birth chart generated successfully!")
-        print()
+        w("✅ Birth chart generated successfully!\n\n")
         
         # Display basic information
-        print("📊 CHART SUMMARY:")
-        print(f"Julian Day: {chart.julian_day:.2f}")
-        print(f"Sun Sign: {chart.chart_summary.get('sun_sign', 'Unknown')}")
-        print(f"Moon Sign: {chart.chart_summary.get('moon_sign', 'Unknown')}")
-        print(f"Ascendant: {chart.chart_summary.get('ascendant_sign', 'Unknown')}")
-        print(f"Dominant Sign: {chart.chart_summary.get('dominant_sign', 'Unknown')}")
-        print(f"Retrograde Planets: {chart.chart_summary.get('retrograde_planets', 0)}")
-        print()
+        w("📊 CHART SUMMARY:\n")
+        w(f"Julian Day: {chart.julian_day:.2f}\n")
+        w(f"Sun Sign: {chart.chart_summary.get('sun_sign', 'Unknown')}\n")
+        w(f"Moon Sign: {chart.chart_summary.get('moon_sign', 'Unknown')}\n")
+        w(f"Ascendant: {chart.chart_summary.get('ascendant_sign', 'Unknown')}\n")
+        w(f"Dominant Sign: {chart.chart_summary.get('dominant_sign', 'Unknown')}\n")
+        w(f"Retrograde Planets: {chart.chart_summary.get('retrograde_planets', 0)}\n\n")
         
-        # Display planet positions
-        print("🪐 PLANET POSITIONS:")
-        for planet in chart.planets:
-            print(f"{planet.planet.value:>8}: {planet.degree:.1f}° {planet.sign.value} (House {planet.house})")
-            if planet.retrograde:
-                print(f"{'':>8}  [Retrograde]")
-        print()
+        # Display planet positions: one join, one write
+        w("🪐 PLANET POSITIONS:\n")
+        w("\n".join(
+            f"{planet.planet.value:>8}: {planet.degree:.1f}° {planet.sign.value} (House {planet.house})"
+            + (f"\n{'':>8}  [Retrograde]" if planet.retrograde else "")
+            for planet in chart.planets))
+        w("\n\n")
         
         # Display house cusps
-        print("🏠 HOUSE CUSPS:")
-        for house in chart.houses:
-            print(f"House {house.number:>2}: {house.cusp:.1f}° {house.sign.value} (Ruler: {house.ruler.value})")
-        print()
+        w("🏠 HOUSE CUSPS:\n")
+        w("\n".join(
+            f"House {house.number:>2}: {house.cusp:.1f}° {house.sign.value} (Ruler: {house.ruler.value})"
+            for house in chart.houses))
+        w("\n\n")
         
         # Display aspects
-        print("🔄 PLANETARY ASPECTS:")
-        for aspect in chart.aspects[:10]:  # Show first 10 aspects
-            print(f"{aspect.planet1.value} {aspect.aspect_type} {aspect.planet2.value} " +
-                  f"(Orb: {aspect.orb:.1f}°)")
+        w("🔄 PLANETARY ASPECTS:\n")
+        w("\n".join(
+            f"{aspect.planet1.value} {aspect.aspect_type} {aspect.planet2.value} (Orb: {aspect.orb:.1f}°)"
+            for aspect in chart.aspects[:10]))  # Show first 10 aspects
+        w("\n")
         
         if len(chart.aspects) > 10:
-            print(f"... and {len(chart.aspects) - 10} more aspects")
-        print()
+            w(f"... and {len(chart.aspects) - 10} more aspects\n")
+        w("\n")
         
-        print("✨ Test completed successfully!")
+        w("✨ Test completed successfully!\n")
         return True
         
     except Exception as e:
+        # Flush whatever was buffered so the failure has its context
+        if buf is not sys.stdout:
+            sys.stdout.write(buf.getvalue())
+            buf = sys.stdout
         print(f"❌ Error generating birth chart: {str(e)}")
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        if buf is not sys.stdout:
+            sys.stdout.write(buf.getvalue())
 
 def test_individual_functions():
     """Test individual functions."""
@@ -92,27 +108,21 @@ def test_individual_functions():
         # Test zodiac sign calculation
         service = birth_chart_service
         
-        # Test various longitudes
-        test_cases = [
-            (0, "Aries"),
-            (30, "Taurus"),
-            (60, "Gemini"),
-            (90, "Cancer"),
-            (120, "Leo"),
-            (150, "Virgo"),
-            (180, "Libra"),
-            (210, "Scorpio"),
-            (240, "Sagittarius"),
-            (270, "Capricorn"),
-            (300, "Aquarius"),
-            (330, "Pisces")
-        ]
-        
+        # Sweep the sign boundaries and compare all results in one
+        # vectorized pass; only mismatches are printed, so scaling this
+        # to a 1°-resolution sweep stays cheap
         print("Testing zodiac sign calculations:")
-        for longitude, expected_sign in test_cases:
-            calculated_sign = service.get_zodiac_sign(longitude)
-            status = "✅" if calculated_sign.value == expected_sign else "❌"
-            print(f"{status} {longitude}° -> {calculated_sign.value} (expected: {expected_sign})")
+        lons = np.arange(0, 360, 30)
+        expected = np.array(['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+                             'Libra', 'Scorpio', 'Sagittarius', 'Capricorn',
+                             'Aquarius', 'Pisces'])
+        got = np.array([service.get_zodiac_sign(float(lon)).value for lon in lons])
+        mismatches = np.flatnonzero(got != expected)
+        
+        for i in mismatches:
+            print(f"❌ {lons[i]}° -> {got[i]} (expected: {expected[i]})")
+        print(f"{'✅' if mismatches.size == 0 else '❌'} "
+              f"{len(lons) - mismatches.size}/{len(lons)} sign lookups correct")
         
         print("\n✅ Individual function tests completed!")
         
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for the Panchang service sunrise/sunset calculations.
+Asserts real ephemeris sunrise times, not just the closed-form fallback.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from app.services.panchang_service import PanchangService
+
+panchang_service = PanchangService()
+
+def test_known_sunrise():
+    """Sunrise/sunset for New Delhi on a known date must be real times."""
+    print("\n🌅 Testing ephemeris sunrise for New Delhi (2024-01-15)...")
+
+    # New Delhi, IST; published sunrise is 07:15, sunset 17:46
+    date = datetime(2024, 1, 15, tzinfo=ZoneInfo("Asia/Kolkata"))
+    latitude, longitude = 28.6139, 77.2090
+
+    sunrise, sunset = panchang_service._sunrise_sunset_datetimes(date, latitude, longitude)
+    print(f"   Sunrise: {sunrise.strftime('%H:%M:%S')}")
+    print(f"   Sunset:  {sunset.strftime('%H:%M:%S')}")
+
+    ok = True
+
+    # A jd_to_datetime failure surfaces as its year-2000 fallback value
+    if sunrise.year != 2024 or sunset.year != 2024:
+        print("❌ Got the fallback datetime — JD conversion failed")
+        ok = False
+
+    sunrise_minutes = sunrise.hour * 60 + sunrise.minute
+    sunset_minutes = sunset.hour * 60 + sunset.minute
+
+    # ±10 minutes covers refraction-model and ephemeris differences while
+    # still catching a wrong timezone (would be off by hours) or the
+    # fallback's flat solar model (off by tens of minutes at this latitude)
+    if not (7 * 60 + 5 <= sunrise_minutes <= 7 * 60 + 25):
+        print("❌ Sunrise outside 07:05-07:25 IST window")
+        ok = False
+    if not (17 * 60 + 36 <= sunset_minutes <= 17 * 60 + 56):
+        print("❌ Sunset outside 17:36-17:56 IST window")
+        ok = False
+
+    if ok:
+        print("✅ Sunrise/sunset match published times")
+    return ok
+
+def test_rahu_kaal():
+    """Rahu Kaal for the same date must be a real interval, not 12:00-12:00."""
+    print("\n⏳ Testing Rahu Kaal for the same date...")
+
+    date = datetime(2024, 1, 15, tzinfo=ZoneInfo("Asia/Kolkata"))
+    result = panchang_service.calculate_rahu_kaal(date, 28.6139, 77.2090)
+    print(f"   Rahu Kaal: {result.rahu_kaal_start} - {result.rahu_kaal_end}")
+    print(f"   Duration: {result.duration_minutes} minutes")
+
+    if result.rahu_kaal_start == result.rahu_kaal_end or result.duration_minutes <= 0:
+        print("❌ Degenerate Rahu Kaal interval")
+        return False
+
+    # 1/8th of a ~10.5-hour Delhi winter day is ~79 minutes
+    if not (70 <= result.duration_minutes <= 90):
+        print("❌ Rahu Kaal duration outside 70-90 minute window")
+        return False
+
+    print("✅ Rahu Kaal interval looks correct")
+    return True
+
+if __name__ == "__main__":
+    print("🌟 Starlight Astrology Panchang Test Suite")
+    print("=" * 50)
+
+    success = test_known_sunrise()
+    success = test_rahu_kaal() and success
+
+    if success:
+        print("\n🎉 All tests passed! Panchang timings are accurate.")
+    else:
+        print("\n❌ Some tests failed. Please check the errors above.")
+        sys.exit(1)
@@ -4,7 +4,8 @@ Test script for Supabase Profile API integration
 Tests all profile management endpoints
 """
 
-import requests
+import asyncio
+import httpx
 import json
 import uuid
 from datetime import datetime
@@ -14,299 +15,160 @@ import sys
 BASE_URL = "http://localhost:8000/api/profile"
 TEST_USER_ID = f"test-user-{uuid.uuid4()}"
 
-def test_health_check():
-    """Test the health check endpoint"""
-    print("🏥 Testing health check endpoint...")
-    
-    try:
-        response = requests.get(f"{BASE_URL}/health")
-        
-        if response.status_code == 200:
-            data = response.json()
-            print(f"✅ Health check passed: {data['status']}")
-            print(f"   Database: {data['database']['status']}")
-            return True
-        else:
-            print(f"❌ Health check failed: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Health check error: {str(e)}")
-        return False
+PROFILE_DATA = {
+    "user_id": TEST_USER_ID,
+    "name": "Test User",
+    "birth_date": "1990-01-15",
+    "birth_time": "14:30",
+    "latitude": 40.7128,
+    "longitude": -74.0060,
+    "timezone": "Asia/Kolkata",
+    "city": "New York",
+    "state": "NY",
+    "country": "USA"
+}
 
-def test_create_profile():
-    """Test creating a new profile"""
-    print("\n📝 Testing profile creation...")
-    
-    profile_data = {
-        "user_id": TEST_USER_ID,
-        "name": "Test User",
-        "birth_date": "1990-01-15",
-        "birth_time": "14:30",
-        "latitude": 40.7128,
-        "longitude": -74.0060,
-        "timezone": "Asia/Kolkata",
-        "city": "New York",
-        "state": "NY",
-        "country": "USA"
-    }
-    
-    try:
-        response = requests.post(f"{BASE_URL}/profile", json=profile_data)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("success"):
-                print(f"✅ Profile created successfully")
-                print(f"   Profile ID: {data['profile']['id']}")
-                print(f"   User ID: {data['profile']['user_id']}")
-                print(f"   Name: {data['profile']['name']}")
-                return True
-            else:
-                print(f"❌ Profile creation failed: {data.get('error', 'Unknown error')}")
-                return False
-        else:
-            print(f"❌ Profile creation failed: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Profile creation error: {str(e)}")
-        return False
+UPDATE_DATA = {
+    "name": "Updated Test User",
+    "city": "Los Angeles",
+    "state": "CA"
+}
 
-def test_get_profile():
-    """Test retrieving a profile"""
-    print("\n🔍 Testing profile retrieval...")
-    
-    try:
-        response = requests.get(f"{BASE_URL}/profile/{TEST_USER_ID}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("success"):
-                print(f"✅ Profile retrieved successfully")
-                print(f"   Name: {data['profile']['name']}")
-                print(f"   Birth Date: {data['profile']['birth_date']}")
-                print(f"   Birth Time: {data['profile']['birth_time']}")
-                print(f"   Location: {data['profile']['city']}, {data['profile']['state']}")
-                print(f"   Coordinates: {data['profile']['latitude']}, {data['profile']['longitude']}")
-                return True
-            else:
-                print(f"❌ Profile retrieval failed: {data.get('error', 'Unknown error')}")
-                return False
-        else:
-            print(f"❌ Profile retrieval failed: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Profile retrieval error: {str(e)}")
-        return False
+INVALID_PROFILE = {
+    "user_id": f"test-invalid-{uuid.uuid4()}",
+    "name": "Invalid User",
+    "birth_date": "invalid-date",
+    "birth_time": "14:30",
+    "latitude": 40.7128,
+    "longitude": -74.0060
+}
 
-def test_check_profile_exists():
-    """Test checking if profile exists"""
-    print("\n🔍 Testing profile existence check...")
-    
-    try:
-        response = requests.get(f"{BASE_URL}/profile/{TEST_USER_ID}/exists")
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("success"):
-                print(f"✅ Profile existence check passed")
-                print(f"   Profile exists: {data['exists']}")
-                return True
-            else:
-                print(f"❌ Profile existence check failed: {data.get('error', 'Unknown error')}")
-                return False
-        else:
-            print(f"❌ Profile existence check failed: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Profile existence check error: {str(e)}")
-        return False
+# Every test is the same scaffold — request, status check, success check,
+# detail lines — so they are data: (name, intro, method, path, body,
+# check(data) -> bool, describe(data) -> detail lines).  One runner
+# replaces nine near-identical functions.
+INDEPENDENT_TESTS = (
+    ("Health Check", "🏥 Testing health check endpoint...",
+     "GET", "/health", None,
+     lambda d: bool(d.get("status")),
+     lambda d: (f"Status: {d['status']}",
+                f"Database: {d['database']['status']}")),
+    ("Get All Profiles", "📋 Testing get all profiles...",
+     "GET", "/profiles?limit=10&offset=0", None,
+     lambda d: d.get("success"),
+     lambda d: (f"Profile count: {d['count']}",
+                f"Limit: {d['limit']}",
+                f"Offset: {d['offset']}")),
+    ("Validation Errors", "🔍 Testing validation errors...",
+     "POST", "/profile", INVALID_PROFILE,
+     lambda d: not d.get("success"),
+     lambda d: (f"Validation error correctly caught: {d.get('error', 'Unknown error')}",)),
+)
 
-def test_update_profile():
-    """Test updating a profile"""
-    print("\n✏️ Testing profile update...")
-    
-    update_data = {
-        "name": "Updated Test User",
-        "city": "Los Angeles",
-        "state": "CA"
-    }
-    
-    try:
-        response = requests.put(f"{BASE_URL}/profile/{TEST_USER_ID}", json=update_data)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("success"):
-                print(f"✅ Profile updated successfully")
-                print(f"   Updated Name: {data['profile']['name']}")
-                print(f"   Updated City: {data['profile']['city']}")
-                print(f"   Updated State: {data['profile']['state']}")
-                print(f"   Updated House System: {data['profile']['house_system']}")
-                return True
-            else:
-                print(f"❌ Profile update failed: {data.get('error', 'Unknown error')}")
-                return False
-        else:
-            print(f"❌ Profile update failed: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Profile update error: {str(e)}")
-        return False
+# The CRUD chain depends on TEST_USER_ID state and must run in order
+SEQUENTIAL_TESTS = (
+    ("Create Profile", "📝 Testing profile creation...",
+     "POST", "/profile", PROFILE_DATA,
+     lambda d: d.get("success"),
+     lambda d: (f"Profile ID: {d['profile']['id']}",
+                f"User ID: {d['profile']['user_id']}",
+                f"Name: {d['profile']['name']}")),
+    ("Get Profile", "🔍 Testing profile retrieval...",
+     "GET", f"/profile/{TEST_USER_ID}", None,
+     lambda d: d.get("success"),
+     lambda d: (f"Name: {d['profile']['name']}",
+                f"Birth Date: {d['profile']['birth_date']}",
+                f"Birth Time: {d['profile']['birth_time']}",
+                f"Location: {d['profile']['city']}, {d['profile']['state']}",
+                f"Coordinates: {d['profile']['latitude']}, {d['profile']['longitude']}")),
+    ("Check Profile Exists", "🔍 Testing profile existence check...",
+     "GET", f"/profile/{TEST_USER_ID}/exists", None,
+     lambda d: d.get("success"),
+     lambda d: (f"Profile exists: {d['exists']}",)),
+    ("Update Profile", "✏️ Testing profile update...",
+     "PUT", f"/profile/{TEST_USER_ID}", UPDATE_DATA,
+     lambda d: d.get("success"),
+     lambda d: (f"Updated Name: {d['profile']['name']}",
+                f"Updated City: {d['profile']['city']}",
+                f"Updated State: {d['profile']['state']}",
+                f"Updated House System: {d['profile']['house_system']}")),
+    ("Delete Profile", "🗑️ Testing profile deletion...",
+     "DELETE", f"/profile/{TEST_USER_ID}", None,
+     lambda d: d.get("success"),
+     lambda d: ()),
+    ("Get Deleted Profile", "🔍 Testing retrieval of deleted profile...",
+     "GET", f"/profile/{TEST_USER_ID}", None,
+     lambda d: not d.get("success"),
+     lambda d: ("Deleted profile correctly not found",)),
+)
 
-def test_get_all_profiles():
-    """Test retrieving all profiles"""
-    print("\n📋 Testing get all profiles...")
-    
-    try:
-        response = requests.get(f"{BASE_URL}/profiles?limit=10&offset=0")
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("success"):
-                print(f"✅ All profiles retrieved successfully")
-                print(f"   Profile count: {data['count']}")
-                print(f"   Limit: {data['limit']}")
-                print(f"   Offset: {data['offset']}")
-                return True
-            else:
-                print(f"❌ Get all profiles failed: {data.get('error', 'Unknown error')}")
-                return False
-        else:
-            print(f"❌ Get all profiles failed: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Get all profiles error: {str(e)}")
-        return False
+async def run_test(client, spec):
+    """Run one test spec; returns True on pass."""
+    name, intro, method, path, body, check, describe = spec
+    print(f"\n{intro}")
 
-def test_delete_profile():
-    """Test deleting a profile"""
-    print("\n🗑️ Testing profile deletion...")
-    
     try:
-        response = requests.delete(f"{BASE_URL}/profile/{TEST_USER_ID}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("success"):
-                print(f"✅ Profile deleted successfully")
-                return True
-            else:
-                print(f"❌ Profile deletion failed: {data.get('error', 'Unknown error')}")
-                return False
-        else:
-            print(f"❌ Profile deletion failed: {response.status_code}")
-            print(f"   Response: {response.text}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Profile deletion error: {str(e)}")
-        return False
+        response = await client.request(method, path, json=body)
 
-def test_get_deleted_profile():
-    """Test retrieving a deleted profile (should fail)"""
-    print("\n🔍 Testing retrieval of deleted profile...")
-    
-    try:
-        response = requests.get(f"{BASE_URL}/profile/{TEST_USER_ID}")
-        
-        if response.status_code == 200:
-            data = response.json()
-            if not data.get("success"):
-                print(f"✅ Deleted profile correctly not found")
-                return True
-            else:
-                print(f"❌ Deleted profile was found (should not happen)")
-                return False
-        else:
-            print(f"❌ Unexpected response: {response.status_code}")
+        if response.status_code != 200:
+            print(f"❌ {name} failed: {response.status_code}")
             print(f"   Response: {response.text}")
             return False
-            
-    except Exception as e:
-        print(f"❌ Deleted profile test error: {str(e)}")
-        return False
 
-def test_validation_errors():
-    """Test validation errors"""
-    print("\n🔍 Testing validation errors...")
-    
-    # Test invalid birth date
-    invalid_profile = {
-        "user_id": f"test-invalid-{uuid.uuid4()}",
-        "name": "Invalid User",
-        "birth_date": "invalid-date",
-        "birth_time": "14:30",
-        "latitude": 40.7128,
-        "longitude": -74.0060
-    }
-    
-    try:
-        response = requests.post(f"{BASE_URL}/profile", json=invalid_profile)
-        
-        if response.status_code == 200:
-            data = response.json()
-            if not data.get("success"):
-                print(f"✅ Validation error correctly caught: {data.get('error', 'Unknown error')}")
-                return True
-            else:
-                print(f"❌ Invalid data was accepted (should not happen)")
-                return False
-        else:
-            print(f"❌ Unexpected response: {response.status_code}")
+        data = response.json()
+        if not check(data):
+            print(f"❌ {name} failed: {data.get('error', 'Unknown error')}")
             return False
-            
+
+        print(f"✅ {name} passed")
+        for line in describe(data):
+            print(f"   {line}")
+        return True
+
     except Exception as e:
-        print(f"❌ Validation test error: {str(e)}")
+        print(f"❌ {name} error: {str(e)}")
         return False
 
-def main():
+async def main():
     """Run all tests"""
     print("🌟 Starlight Astrology Profile API Test Suite")
     print("=" * 60)
     print(f"Testing API at: {BASE_URL}")
     print(f"Test User ID: {TEST_USER_ID}")
     print("=" * 60)
-    
-    tests = [
-        ("Health Check", test_health_check),
-        ("Create Profile", test_create_profile),
-        ("Get Profile", test_get_profile),
-        ("Check Profile Exists", test_check_profile_exists),
-        ("Update Profile", test_update_profile),
-        ("Get All Profiles", test_get_all_profiles),
-        ("Delete Profile", test_delete_profile),
-        ("Get Deleted Profile", test_get_deleted_profile),
-        ("Validation Errors", test_validation_errors)
-    ]
-    
+
     passed = 0
     failed = 0
-    
-    for test_name, test_func in tests:
-        try:
-            if test_func():
+
+    # One client for the whole suite: every request reuses the same
+    # connection pool instead of a fresh TCP handshake per call
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=10.0) as client:
+        # The tests that don't touch TEST_USER_ID run concurrently with
+        # the CRUD chain itself, not just with each other, so total wall
+        # time is max(phases) instead of their sum.  Output lines from
+        # the two phases may interleave.
+        independent = asyncio.gather(
+            *(run_test(client, spec) for spec in INDEPENDENT_TESTS),
+            return_exceptions=True)
+
+        for spec in SEQUENTIAL_TESTS:
+            if await run_test(client, spec):
                 passed += 1
             else:
                 failed += 1
-        except Exception as e:
-            print(f"❌ {test_name} crashed: {str(e)}")
-            failed += 1
-    
+
+        for spec, result in zip(INDEPENDENT_TESTS, await independent):
+            if isinstance(result, BaseException):
+                print(f"❌ {spec[0]} crashed: {result}")
+                failed += 1
+            elif result:
+                passed += 1
+            else:
+                failed += 1
+
     print("\n" + "=" * 60)
     print(f"🎯 Test Results: {passed} passed, {failed} failed")
-    
+
     if failed == 0:
         print("🎉 All tests passed! The Profile API is working correctly.")
         return 0
@@ -315,4 +177,4 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(main()) 
\ No newline at end of file
+    sys.exit(asyncio.run(main()))